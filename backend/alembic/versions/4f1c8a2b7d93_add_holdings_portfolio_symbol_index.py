@@ -0,0 +1,29 @@
+"""add_holdings_portfolio_symbol_index
+
+Revision ID: 4f1c8a2b7d93
+Revises: ea0a0dc2a7e9
+Create Date: 2026-10-15 09:12:41.503218
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4f1c8a2b7d93'
+down_revision = 'ea0a0dc2a7e9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_holdings_portfolio_symbol',
+        'portfolio_holdings',
+        ['portfolio_id', 'symbol'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_holdings_portfolio_symbol', table_name='portfolio_holdings')
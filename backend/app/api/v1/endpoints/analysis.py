@@ -322,8 +322,8 @@ Return ONLY a valid JSON object with these exact keys (no markdown, no extra tex
 
     try:
         import anthropic
-        client = anthropic.Anthropic(api_key=cfg.anthropic_api_key)
-        msg = client.messages.create(
+        client = anthropic.AsyncAnthropic(api_key=cfg.anthropic_api_key)
+        msg = await client.messages.create(
             model="claude-sonnet-4-6",  # Use Sonnet for richer analysis
             max_tokens=2500,
             messages=[{"role": "user", "content": prompt}],
@@ -1,14 +1,14 @@
 from typing import Any, List, Optional
 
 from fastapi import APIRouter, Depends
-from pydantic import BaseModel
-from sqlalchemy import select
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user
 from app.db.session import get_db
 from app.models.user import User
-from app.models.portfolio import Portfolio
+from app.models.portfolio import Portfolio, PortfolioHolding
 from app.schemas.wallet import WalletBalanceResponse
 
 router = APIRouter()
@@ -23,6 +23,7 @@ class MarketIndex(BaseModel):
 
 
 class PortfolioSummary(BaseModel):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
     id: int
     name: str
     total_value: float
@@ -33,11 +34,9 @@ class PortfolioSummary(BaseModel):
     total_return_pct: float = 0.0
     holdings_count: int = 0
 
-    class Config:
-        from_attributes = True
-
 
 class DashboardResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
     user_id: int
     user_email: str
     user_name: str
@@ -48,9 +47,6 @@ class DashboardResponse(BaseModel):
     total_invested: float
     total_available: float
 
-    class Config:
-        from_attributes = True
-
 
 @router.get("", response_model=DashboardResponse)
 async def get_dashboard(
@@ -69,11 +65,19 @@ async def get_dashboard(
     )
     portfolios = result.scalars().all()
 
+    # Only the count is needed, so aggregate instead of loading every holding
+    count_result = await db.execute(
+        select(PortfolioHolding.portfolio_id, func.count(PortfolioHolding.id))
+        .where(PortfolioHolding.portfolio_id.in_([p.id for p in portfolios]))
+        .group_by(PortfolioHolding.portfolio_id)
+    )
+    holdings_counts = dict(count_result.all())
+
     portfolio_summaries = []
     total_portfolio_value = 0.0
 
     for portfolio in portfolios:
-        holdings_count = len(portfolio.holdings)
+        holdings_count = holdings_counts.get(portfolio.id, 0)
         total_value = portfolio.total_value or 0.0
         invested = portfolio.invested_amount or 0.0
 
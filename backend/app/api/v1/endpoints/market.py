@@ -1,8 +1,10 @@
 """Market data API endpoints."""
 
-from typing import Any, List, Optional
+import json
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from app.api.deps import get_current_user, get_current_user_optional
@@ -154,14 +156,8 @@ async def search_stocks(
     return [StockSearchResult(**r) for r in results]
 
 
-@router.get("/ai-analysis/{symbol}", response_model=AIStockAnalysisResponse)
-async def get_ai_stock_analysis(
-    symbol: str,
-    current_user: User = Depends(get_current_user),
-) -> Any:
-    """Get AI analysis for a stock."""
-    from app.services.llm_service import llm_service
-
+async def _stock_analysis_inputs(symbol: str) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """Collect the quote data and company info fed to the AI stock analysis."""
     # Get quote data (may be None if market data API is unavailable)
     quote = await market_data_service.get_quote(symbol)
 
@@ -199,6 +195,19 @@ async def get_ai_stock_analysis(
                 "market_cap": profile.market_cap,
             }
 
+    return quote_data, company_info
+
+
+@router.get("/ai-analysis/{symbol}", response_model=AIStockAnalysisResponse)
+async def get_ai_stock_analysis(
+    symbol: str,
+    current_user: User = Depends(get_current_user),
+) -> Any:
+    """Get AI analysis for a stock."""
+    from app.services.llm_service import llm_service
+
+    quote_data, company_info = await _stock_analysis_inputs(symbol)
+
     # Get AI analysis (always returns a result via rule-based fallback when LLM is unavailable)
     analysis = await llm_service.analyze_stock(symbol, quote_data, company_info)
 
@@ -216,3 +225,25 @@ async def get_ai_stock_analysis(
         key_factors=analysis.key_factors,
         risk_level=analysis.risk_level,
     )
+
+
+@router.get("/ai-analysis/{symbol}/stream")
+async def stream_ai_stock_analysis(
+    symbol: str,
+    current_user: User = Depends(get_current_user),
+) -> StreamingResponse:
+    """
+    Stream AI analysis for a stock as newline-delimited JSON.
+
+    Each line holds the analysis fields completed so far, so the client can
+    render the signal before the rationale has finished generating.
+    """
+    from app.services.llm_service import llm_service
+
+    quote_data, company_info = await _stock_analysis_inputs(symbol)
+
+    async def lines():
+        async for partial in llm_service.stream_stock_analysis(symbol, quote_data, company_info):
+            yield json.dumps(partial) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
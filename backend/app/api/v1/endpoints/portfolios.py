@@ -14,6 +14,7 @@ import numpy as np
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from loguru import logger
 
 from app.api.deps import get_current_user
@@ -140,7 +141,8 @@ async def _generate_stock_reasoning(
             f"2. Why it's appropriate for a {risk_profile} investor\n\n"
             f"Format: SYMBOL: [reason]\nBe specific, factual, and professional. No markdown."
         )
-        result = query_claude(prompt)
+        # query_claude is synchronous (SDK call + Redis); keep it off the event loop
+        result = await asyncio.to_thread(query_claude, prompt)
         return result.get("result", "")
     except Exception as exc:
         logger.warning("Claude reasoning failed: {}", exc)
@@ -162,12 +164,31 @@ async def _generate_portfolio_explanation(
             f"Explain: what this portfolio is, how it fits {risk_profile} profile, "
             f"what market trends it captures, and the key risk. Be professional and specific."
         )
-        return query_claude(prompt).get("result", "")
+        result = await asyncio.to_thread(query_claude, prompt)
+        return result.get("result", "")
     except Exception:
         return (f"AI-optimised {risk_profile} portfolio across {len(assets)} positions. "
                 f"Expected return {exp_return:.1%}, volatility {volatility:.1%}.")
 
 
+async def _load_portfolio(db: AsyncSession, portfolio_id: int, user_id: int) -> Optional[Portfolio]:
+    """
+    Fetch a user's portfolio with its holdings loaded in one extra query.
+
+    Portfolio.holdings is lazy="raise_on_sql", so every path that reads
+    holdings (including PortfolioResponse serialisation) goes through here.
+    populate_existing re-reads an instance already in the session, which makes
+    this double as the post-commit refresh.
+    """
+    result = await db.execute(
+        select(Portfolio)
+        .options(selectinload(Portfolio.holdings))
+        .where(Portfolio.id == portfolio_id, Portfolio.user_id == user_id)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none()
+
+
 # ---------------------------------------------------------------------------
 # Endpoints
 # ---------------------------------------------------------------------------
@@ -179,7 +200,10 @@ async def get_portfolios(
     skip: int = 0, limit: int = 100,
 ) -> Any:
     result = await db.execute(
-        select(Portfolio).where(Portfolio.user_id == current_user.id).offset(skip).limit(limit)
+        select(Portfolio)
+        .options(selectinload(Portfolio.holdings))
+        .where(Portfolio.user_id == current_user.id)
+        .offset(skip).limit(limit)
     )
     return result.scalars().all()
 
@@ -398,7 +422,7 @@ async def create_portfolio(
         ))
 
         await db.commit()
-        await db.refresh(portfolio)
+        portfolio = await _load_portfolio(db, portfolio.id, current_user.id)
         logger.info("Portfolio {} created — {} stocks, er={:.1%}, vol={:.1%}, src={}",
                     portfolio.id, len(selected_symbols),
                     allocation.expected_return, allocation.volatility,
@@ -432,10 +456,7 @@ async def get_portfolio(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
-    result = await db.execute(
-        select(Portfolio).where(Portfolio.id == portfolio_id, Portfolio.user_id == current_user.id)
-    )
-    portfolio = result.scalar_one_or_none()
+    portfolio = await _load_portfolio(db, portfolio_id, current_user.id)
     if not portfolio:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Portfolio not found")
     return portfolio
@@ -461,14 +482,11 @@ async def refresh_portfolio_prices(
 ) -> Any:
     """Refresh holding prices from Finnhub and update portfolio total_value."""
     from app.services.portfolio_updater import update_portfolio_prices
-    result = await db.execute(
-        select(Portfolio).where(Portfolio.id == portfolio_id, Portfolio.user_id == current_user.id)
-    )
-    portfolio = result.scalar_one_or_none()
+    portfolio = await _load_portfolio(db, portfolio_id, current_user.id)
     if not portfolio:
         raise HTTPException(status_code=404, detail="Portfolio not found")
     new_value = await update_portfolio_prices(db, portfolio_id)
-    await db.refresh(portfolio)
+    portfolio = await _load_portfolio(db, portfolio_id, current_user.id)
     return {"portfolio_id": portfolio_id, "new_total_value": new_value, "portfolio": portfolio}
 
 
@@ -500,16 +518,13 @@ async def update_portfolio(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
-    result = await db.execute(
-        select(Portfolio).where(Portfolio.id == portfolio_id, Portfolio.user_id == current_user.id)
-    )
-    portfolio = result.scalar_one_or_none()
+    portfolio = await _load_portfolio(db, portfolio_id, current_user.id)
     if not portfolio:
         raise HTTPException(status_code=404, detail="Portfolio not found")
     for field, value in portfolio_update.model_dump(exclude_unset=True).items():
         setattr(portfolio, field, value)
     await db.commit()
-    await db.refresh(portfolio)
+    portfolio = await _load_portfolio(db, portfolio_id, current_user.id)
     return portfolio
 
 
@@ -519,10 +534,7 @@ async def delete_portfolio(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
-    result = await db.execute(
-        select(Portfolio).where(Portfolio.id == portfolio_id, Portfolio.user_id == current_user.id)
-    )
-    portfolio = result.scalar_one_or_none()
+    portfolio = await _load_portfolio(db, portfolio_id, current_user.id)
     if not portfolio:
         raise HTTPException(status_code=404, detail="Portfolio not found")
     await db.delete(portfolio)
@@ -560,10 +572,7 @@ async def rebalance_portfolio(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
-    result = await db.execute(
-        select(Portfolio).where(Portfolio.id == portfolio_id, Portfolio.user_id == current_user.id)
-    )
-    portfolio = result.scalar_one_or_none()
+    portfolio = await _load_portfolio(db, portfolio_id, current_user.id)
     if not portfolio:
         raise HTTPException(status_code=404, detail="Portfolio not found")
     total = portfolio.total_value or 0
@@ -593,10 +602,7 @@ async def sell_holding(
     """
 
     # ── Fetch portfolio ─────────────────────────────────────────────────────
-    result = await db.execute(
-        select(Portfolio).where(Portfolio.id == portfolio_id, Portfolio.user_id == current_user.id)
-    )
-    portfolio = result.scalar_one_or_none()
+    portfolio = await _load_portfolio(db, portfolio_id, current_user.id)
     if not portfolio:
         raise HTTPException(status_code=404, detail="Portfolio not found")
 
@@ -668,7 +674,7 @@ async def sell_holding(
 
     # ── Flush so SQLAlchemy sees the deleted/updated holding ──────────────────
     await db.flush()
-    await db.refresh(portfolio)
+    portfolio = await _load_portfolio(db, portfolio_id, current_user.id)
 
     # ── Recalculate portfolio total_value and weights ─────────────────────────
     remaining_holdings = [h for h in portfolio.holdings]
@@ -680,7 +686,7 @@ async def sell_holding(
             h.weight = round(h.market_value / new_total, 6)
 
     await db.commit()
-    await db.refresh(portfolio)
+    portfolio = await _load_portfolio(db, portfolio_id, current_user.id)
     logger.info(
         "Sold {} shares of {} from portfolio {} — proceeds ${}, new total ${}",
         qty_to_sell, symbol, portfolio_id, proceeds, new_total,
@@ -718,10 +724,7 @@ async def add_holding(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
-    result = await db.execute(
-        select(Portfolio).where(Portfolio.id == portfolio_id, Portfolio.user_id == current_user.id)
-    )
-    portfolio = result.scalar_one_or_none()
+    portfolio = await _load_portfolio(db, portfolio_id, current_user.id)
     if not portfolio:
         raise HTTPException(status_code=404, detail="Portfolio not found")
     from app.services.market_data import market_data_service
@@ -736,5 +739,5 @@ async def add_holding(
     db.add(holding)
     portfolio.total_value = (portfolio.total_value or 0) + holding.market_value
     await db.commit()
-    await db.refresh(portfolio)
+    portfolio = await _load_portfolio(db, portfolio_id, current_user.id)
     return portfolio
@@ -1,4 +1,9 @@
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
 import redis
+import redis.asyncio
 from loguru import logger
 from app.core.config import get_settings
 
@@ -21,6 +26,34 @@ class _NoopCache:
         self._store.pop(key, None)
 
 
+class TTLCache:
+    """Bounded LRU mapping whose entries expire `ttl` seconds after being set."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the live value for `key`, or None if missing or expired."""
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Insert or refresh `key`, evicting the least recently used entry if full."""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+
 def _build_cache():
     try:
         client = redis.Redis.from_url(settings.redis_url, decode_responses=True, socket_connect_timeout=2)
@@ -33,3 +66,14 @@ def _build_cache():
 
 
 cache = _build_cache()
+
+
+def _build_async_cache() -> Optional[redis.asyncio.Redis]:
+    """Async client on the same Redis for the event loop, or None on the fallback cache."""
+    if isinstance(cache, _NoopCache):
+        return None
+    # Binary values (decode_responses off); connections open lazily on the running loop
+    return redis.asyncio.Redis.from_url(settings.redis_url, socket_connect_timeout=2)
+
+
+async_cache = _build_async_cache()
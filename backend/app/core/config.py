@@ -39,9 +39,11 @@ class Settings(BaseSettings):
     alpha_vantage_api_key: Optional[str] = Field(default=None, alias="ALPHA_VANTAGE_API_KEY")
     news_api_key: Optional[str] = Field(default=None, alias="NEWS_API_KEY")
     polygon_api_key: Optional[str] = Field(default=None, alias="POLYGON_API_KEY")
+    finnhub_rpm: int = Field(default=60, alias="FINNHUB_RPM")
 
     # AI / LLM — Anthropic Claude (primary)
     anthropic_api_key: Optional[str] = Field(default=None, alias="ANTHROPIC_API_KEY")
+    anthropic_rpm: int = Field(default=50, alias="ANTHROPIC_RPM")
 
     # Email / SMTP (optional — OTP returned in API response if not configured)
     smtp_host: Optional[str] = Field(default=None, alias="SMTP_HOST")
@@ -59,6 +61,7 @@ class Settings(BaseSettings):
     raw_data_path: str = Field(default="./data/raw", alias="RAW_DATA_PATH")
     processed_data_path: str = Field(default="./data/processed", alias="PROCESSED_DATA_PATH")
     qlib_data_path: str = Field(default="./data/qlib_data", alias="QLIB_DATA_PATH")
+    candle_cache_path: str = Field(default="./data/cache/candles", alias="CANDLE_CACHE_PATH")
 
     # Model Settings
     model_cache_path: str = Field(default="./models/cache", alias="MODEL_CACHE_PATH")
@@ -0,0 +1,65 @@
+"""Client-side rate limiting for third-party APIs."""
+
+import asyncio
+import time
+from typing import Optional
+
+
+class AsyncRateLimiter:
+    """
+    Token bucket allowing `rate` acquisitions per `period` seconds.
+
+    Callers queue on `async with limiter:` instead of being answered with a
+    429 by the provider. The bucket starts full, so short bursts up to `rate`
+    go through immediately and sustained load is spread evenly.
+
+    Args:
+        rate: Requests allowed per period
+        period: Window length in seconds
+    """
+
+    def __init__(self, rate: int, period: float = 60.0):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.period = period
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate / self.period)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a request slot is free and take it."""
+        # Waiters queue on the lock, so slots are handed out in arrival order
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) * self.period / self.rate)
+
+    def sync_remaining(self, remaining: Optional[int]) -> None:
+        """
+        Clamp the local budget to what the provider reports as left.
+
+        Keeps the bucket honest when other processes share the same API key.
+
+        Args:
+            remaining: Value of the provider's rate-limit-remaining header
+        """
+        if remaining is None:
+            return
+        self._refill()
+        self._tokens = min(self._tokens, float(max(remaining, 0)))
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
@@ -180,30 +180,22 @@ class PortfolioEngine:
         Returns:
             List of stress test results
         """
-        if scenarios is None:
-            scenarios = [
-                "market_crash",
-                "interest_rate_shock",
-                "inflation_spike",
-                "tech_bubble_burst",
-            ]
+        results = self.risk_engine.stress_test_batch(
+            portfolio_weights=portfolio_weights,
+            scenarios=scenarios,
+        )
 
-        results = []
-        for scenario in scenarios:
-            result = self.risk_engine.stress_test(
-                portfolio_weights=portfolio_weights,
-                scenario=scenario,
-            )
-            results.append({
+        return [
+            {
                 "scenario": result.scenario_name,
                 "description": result.description,
                 "portfolio_loss_pct": result.portfolio_loss_pct,
                 "var_breach": result.var_breach,
                 "recovery_time_days": result.recovery_time_days,
                 "worst_affected_assets": result.worst_affected_assets,
-            })
-
-        return results
+            }
+            for result in results
+        ]
 
     async def get_optimization_methods(self) -> List[Dict[str, Any]]:
         """Get available optimization methods."""
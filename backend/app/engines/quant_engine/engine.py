@@ -1,5 +1,5 @@
 from typing import Dict, List, Any
-from datetime import datetime, timedelta
+from datetime import datetime
 import random
 import numpy as np
 
@@ -10,9 +10,17 @@ from app.engines.quant_engine.models import (
     SignalResult,
     BacktestResult,
     FactorExposure,
+    EQUITY_CURVE_DTYPE,
+    MONTHLY_RETURNS_DTYPE,
+    DRAWDOWN_SERIES_DTYPE,
 )
 from app.engines.quant_engine.factors import FactorEngine
 
+# Feature names reported in PredictionResult.feature_importance, in the
+# order their raw magnitudes are computed by _predict_single_asset.
+_FEATURE_KEYS = ("momentum_1m", "momentum_3m", "rsi", "sma_20_ratio", "sma_50_ratio")
+_FEATURE_WEIGHTS = np.array([0.40, 0.25, 0.20, 0.10, 0.05])
+
 
 class QuantEngine:
     """
@@ -105,15 +113,25 @@ class QuantEngine:
             predictions[symbol] = prediction
             self.prediction_cache[symbol] = prediction
 
-        # Rank assets by predicted return
-        rankings = sorted(
-            predictions.keys(),
-            key=lambda x: predictions[x].predicted_return,
-            reverse=True
+        # Pull the numeric fields into arrays once for ranking and aggregates
+        symbols = list(predictions)
+        returns = np.fromiter(
+            (predictions[s].predicted_return for s in symbols),
+            dtype=np.float64,
+            count=len(symbols),
+        )
+        confidences = np.fromiter(
+            (predictions[s].confidence for s in symbols),
+            dtype=np.float64,
+            count=len(symbols),
         )
 
+        # Rank assets by predicted return (stable, so ties keep input order)
+        order = np.argsort(-returns, kind="stable")
+        rankings = [symbols[i] for i in order]
+
         # Determine market regime
-        avg_return = np.mean([p.predicted_return for p in predictions.values()])
+        avg_return = returns.mean()
         if avg_return > 0.02:
             regime = "bull"
         elif avg_return < -0.02:
@@ -122,7 +140,7 @@ class QuantEngine:
             regime = "sideways"
 
         # Calculate overall confidence
-        avg_confidence = np.mean([p.confidence for p in predictions.values()])
+        avg_confidence = confidences.mean()
 
         return SignalResult(
             predictions=predictions,
@@ -209,16 +227,21 @@ class QuantEngine:
             signal_agreement = abs(combined)
             confidence = min(0.90, 0.55 + signal_agreement * 0.30)
 
-            # Feature importance (relative magnitudes)
-            feature_importance = {
-                "momentum_1m": round(abs(momentum_signal) * 0.40, 4),
-                "momentum_3m": round(abs(momentum_3m) * 0.25, 4),
-                "rsi": round((1 - signal_agreement) * 0.20, 4),
-                "sma_20_ratio": round(abs(price_vs_sma20) * 0.10, 4),
-                "sma_50_ratio": round(abs(price_vs_sma50) * 0.05, 4),
-            }
-            total = sum(feature_importance.values()) or 1.0
-            feature_importance = {k: round(v / total, 4) for k, v in feature_importance.items()}
+            # Feature importance (relative magnitudes), normalised in one pass
+            raw_importance = np.round(
+                np.abs([
+                    momentum_signal,
+                    momentum_3m,
+                    1 - signal_agreement,
+                    price_vs_sma20,
+                    price_vs_sma50,
+                ]) * _FEATURE_WEIGHTS,
+                4,
+            )
+            total = raw_importance.sum() or 1.0
+            feature_importance = dict(
+                zip(_FEATURE_KEYS, np.round(raw_importance / total, 4).tolist())
+            )
 
             return PredictionResult(
                 symbol=symbol,
@@ -239,13 +262,7 @@ class QuantEngine:
                 predicted_return=0.05,  # conservative 5% expected return
                 confidence=0.55,
                 uncertainty=0.15,
-                feature_importance={
-                    "momentum_1m": 0.30,
-                    "momentum_3m": 0.25,
-                    "rsi": 0.20,
-                    "sma_20_ratio": 0.15,
-                    "sma_50_ratio": 0.10,
-                },
+                feature_importance=dict(zip(_FEATURE_KEYS, (0.30, 0.25, 0.20, 0.15, 0.10))),
                 attention_weights=None,
                 prediction_horizon=config.prediction_horizon,
             )
@@ -289,26 +306,20 @@ class QuantEngine:
         max_drawdown = random.uniform(0.10, 0.25)
         win_rate = random.uniform(0.55, 0.70)
 
-        # Generate equity curve
-        equity_curve = []
-        current_value = initial_capital
+        # Generate equity curve: monthly points, random walk with upward drift
+        offsets = np.arange(0, max(days, 0), 30)
+        monthly = np.random.normal(annual_return / 12, volatility / np.sqrt(12), offsets.size)
+        values = initial_capital * np.cumprod(1 + monthly)
+        current_value = float(values[-1]) if values.size else initial_capital
 
-        for i in range(0, days, 30):  # Monthly points
-            date = start_date + timedelta(days=i)
-            # Random walk with upward drift
-            monthly_return = random.gauss(annual_return / 12, volatility / np.sqrt(12))
-            current_value *= (1 + monthly_return)
-
-            equity_curve.append({
-                "date": date.strftime("%Y-%m-%d"),
-                "value": round(current_value, 2),
-            })
+        equity_curve = np.empty(offsets.size, dtype=EQUITY_CURVE_DTYPE)
+        equity_curve["date"] = np.datetime64(start_date.date(), "D") + offsets
+        equity_curve["value"] = np.round(values, 2)
 
         # Generate monthly returns
-        monthly_returns = [
-            {"month": f"2023-{i:02d}", "return": round(random.gauss(0.01, 0.05), 4)}
-            for i in range(1, 13)
-        ]
+        monthly_returns = np.empty(12, dtype=MONTHLY_RETURNS_DTYPE)
+        monthly_returns["month"] = np.arange("2023-01", "2024-01", dtype="datetime64[M]")
+        monthly_returns["return"] = np.round(np.random.normal(0.01, 0.05, 12), 4)
 
         return BacktestResult(
             total_return=current_value - initial_capital,
@@ -325,7 +336,7 @@ class QuantEngine:
             avg_trade_return=random.uniform(0.005, 0.02),
             equity_curve=equity_curve,
             monthly_returns=monthly_returns,
-            drawdown_series=[],  # Would calculate in production
+            drawdown_series=np.empty(0, dtype=DRAWDOWN_SERIES_DTYPE),  # Would calculate in production
             trade_history=[],  # Would track in production
         )
 
@@ -1,10 +1,105 @@
-from typing import Dict, List, Optional
+import hashlib
+from collections import OrderedDict
+from functools import wraps
+from types import MappingProxyType
+from typing import Hashable, List, Mapping, Optional, Tuple
 from dataclasses import dataclass
 import numpy as np
 import pandas as pd
 
+from app.engines.quant_engine import factors_gpu
+from app.engines.quant_engine import factors_kernels as kernels
 
-@dataclass
+
+def _column_values(prices: pd.DataFrame, name: str, position: int) -> np.ndarray:
+    """Fetch an OHLC column (by name, else by position) as a float64 array."""
+    column = prices[name] if name in prices.columns else prices.iloc[:, position]
+    return np.ascontiguousarray(column.to_numpy(dtype=np.float64))
+
+
+def _price_arrays(prices: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convert the high/low/close columns to contiguous float64 arrays in one go.
+
+    A homogeneous OHLC frame converts to a single column-major block, so the
+    column views are already contiguous and no per-column copy is made.
+    """
+    if {"high", "low", "close"}.issubset(prices.columns):
+        block = prices[["high", "low", "close"]].to_numpy(dtype=np.float64)
+        return tuple(np.ascontiguousarray(block[:, j]) for j in range(3))
+    return (
+        _column_values(prices, "high", 0),
+        _column_values(prices, "low", 1),
+        _column_values(prices, "close", -1),
+    )
+
+
+def _volume_values(volumes: pd.DataFrame, index: pd.Index) -> np.ndarray:
+    """Align a single-column volume frame (or Series) to `index` as float64."""
+    if isinstance(volumes, pd.DataFrame):
+        volumes = volumes.iloc[:, 0]
+    return np.ascontiguousarray(volumes.reindex(index).to_numpy(dtype=np.float64))
+
+
+def _frame_fingerprint(
+    prices: pd.DataFrame,
+    volumes: pd.DataFrame,
+    dtype: np.dtype
+) -> Optional[Tuple[Hashable, ...]]:
+    """
+    Cache key for a price/volume pair: shape, columns, dtype and a content digest.
+
+    The digest covers every row and index label, so revised history (gaps,
+    split or dividend adjustments) never reuses factors computed for other data.
+    """
+    if prices.empty:
+        return None
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(pd.util.hash_pandas_object(prices, index=True).to_numpy().tobytes())
+    digest.update(pd.util.hash_pandas_object(volumes, index=True).to_numpy().tobytes())
+    return (
+        prices.shape,
+        tuple(prices.columns),
+        len(volumes),
+        np.dtype(dtype).str,
+        digest.digest(),
+    )
+
+
+def cached_indicator(maxsize: int = 64):
+    """
+    Memoize a factor calculation in a bounded LRU keyed by _frame_fingerprint.
+
+    Callers receive a copy so they cannot mutate the cached frame. The
+    wrapped function exposes `cache_clear()`.
+    """
+    def decorator(func):
+        cache: "OrderedDict[Tuple[Hashable, ...], pd.DataFrame]" = OrderedDict()
+
+        @wraps(func)
+        def wrapper(self, prices, volumes, dtype=np.float32):
+            key = _frame_fingerprint(prices, volumes, dtype)
+            if key is None:
+                return func(self, prices, volumes, dtype)
+
+            result = cache.get(key)
+            if result is not None:
+                cache.move_to_end(key)
+                return result.copy()
+
+            result = func(self, prices, volumes, dtype)
+            cache[key] = result
+            if len(cache) > maxsize:
+                cache.popitem(last=False)
+            return result.copy()
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
+
+
+@dataclass(frozen=True, slots=True)
 class AlphaFactor:
     """Represents an alpha factor for prediction."""
     name: str
@@ -13,160 +108,163 @@ class AlphaFactor:
     formula: Optional[str] = None
 
 
+# All available alpha factors. Built once at import and shared read-only by
+# every FactorEngine instance.
+_FACTORS: Mapping[str, AlphaFactor] = MappingProxyType({
+    # Momentum factors
+    "momentum_1m": AlphaFactor(
+        name="momentum_1m",
+        description="1-month price momentum",
+        category="momentum",
+        formula="(close - close_20) / close_20"
+    ),
+    "momentum_3m": AlphaFactor(
+        name="momentum_3m",
+        description="3-month price momentum",
+        category="momentum",
+        formula="(close - close_60) / close_60"
+    ),
+    "momentum_12m": AlphaFactor(
+        name="momentum_12m",
+        description="12-month price momentum (excluding last month)",
+        category="momentum",
+        formula="(close_20 - close_240) / close_240"
+    ),
+    "rsi": AlphaFactor(
+        name="rsi",
+        description="Relative Strength Index",
+        category="momentum",
+    ),
+    "macd": AlphaFactor(
+        name="macd",
+        description="MACD indicator",
+        category="momentum",
+    ),
+
+    # Value factors
+    "pe_ratio": AlphaFactor(
+        name="pe_ratio",
+        description="Price to Earnings ratio",
+        category="value",
+    ),
+    "pb_ratio": AlphaFactor(
+        name="pb_ratio",
+        description="Price to Book ratio",
+        category="value",
+    ),
+    "ps_ratio": AlphaFactor(
+        name="ps_ratio",
+        description="Price to Sales ratio",
+        category="value",
+    ),
+    "dividend_yield": AlphaFactor(
+        name="dividend_yield",
+        description="Dividend yield",
+        category="value",
+    ),
+    "ev_ebitda": AlphaFactor(
+        name="ev_ebitda",
+        description="Enterprise Value to EBITDA",
+        category="value",
+    ),
+
+    # Quality factors
+    "roe": AlphaFactor(
+        name="roe",
+        description="Return on Equity",
+        category="quality",
+    ),
+    "roa": AlphaFactor(
+        name="roa",
+        description="Return on Assets",
+        category="quality",
+    ),
+    "gross_margin": AlphaFactor(
+        name="gross_margin",
+        description="Gross profit margin",
+        category="quality",
+    ),
+    "debt_to_equity": AlphaFactor(
+        name="debt_to_equity",
+        description="Debt to Equity ratio",
+        category="quality",
+    ),
+    "current_ratio": AlphaFactor(
+        name="current_ratio",
+        description="Current ratio",
+        category="quality",
+    ),
+
+    # Volatility factors
+    "volatility_20d": AlphaFactor(
+        name="volatility_20d",
+        description="20-day realized volatility",
+        category="volatility",
+    ),
+    "volatility_60d": AlphaFactor(
+        name="volatility_60d",
+        description="60-day realized volatility",
+        category="volatility",
+    ),
+    "max_drawdown_1m": AlphaFactor(
+        name="max_drawdown_1m",
+        description="1-month maximum drawdown",
+        category="volatility",
+    ),
+    "beta": AlphaFactor(
+        name="beta",
+        description="Market beta",
+        category="volatility",
+    ),
+
+    # Liquidity factors
+    "avg_volume": AlphaFactor(
+        name="avg_volume",
+        description="Average trading volume",
+        category="liquidity",
+    ),
+    "volume_volatility": AlphaFactor(
+        name="volume_volatility",
+        description="Volume volatility",
+        category="liquidity",
+    ),
+    "turnover": AlphaFactor(
+        name="turnover",
+        description="Share turnover ratio",
+        category="liquidity",
+    ),
+
+    # Technical factors
+    "sma_ratio": AlphaFactor(
+        name="sma_ratio",
+        description="Price to Simple Moving Average ratio",
+        category="technical",
+    ),
+    "bb_position": AlphaFactor(
+        name="bb_position",
+        description="Bollinger Bands position",
+        category="technical",
+    ),
+    "atr": AlphaFactor(
+        name="atr",
+        description="Average True Range",
+        category="technical",
+    ),
+})
+
+
 class FactorEngine:
     """Generates alpha factors for deep learning models."""
 
     def __init__(self):
-        self.factors = self._initialize_factors()
-
-    def _initialize_factors(self) -> Dict[str, AlphaFactor]:
-        """Initialize all available alpha factors."""
-        return {
-            # Momentum factors
-            "momentum_1m": AlphaFactor(
-                name="momentum_1m",
-                description="1-month price momentum",
-                category="momentum",
-                formula="(close - close_20) / close_20"
-            ),
-            "momentum_3m": AlphaFactor(
-                name="momentum_3m",
-                description="3-month price momentum",
-                category="momentum",
-                formula="(close - close_60) / close_60"
-            ),
-            "momentum_12m": AlphaFactor(
-                name="momentum_12m",
-                description="12-month price momentum (excluding last month)",
-                category="momentum",
-                formula="(close_20 - close_240) / close_240"
-            ),
-            "rsi": AlphaFactor(
-                name="rsi",
-                description="Relative Strength Index",
-                category="momentum",
-            ),
-            "macd": AlphaFactor(
-                name="macd",
-                description="MACD indicator",
-                category="momentum",
-            ),
-
-            # Value factors
-            "pe_ratio": AlphaFactor(
-                name="pe_ratio",
-                description="Price to Earnings ratio",
-                category="value",
-            ),
-            "pb_ratio": AlphaFactor(
-                name="pb_ratio",
-                description="Price to Book ratio",
-                category="value",
-            ),
-            "ps_ratio": AlphaFactor(
-                name="ps_ratio",
-                description="Price to Sales ratio",
-                category="value",
-            ),
-            "dividend_yield": AlphaFactor(
-                name="dividend_yield",
-                description="Dividend yield",
-                category="value",
-            ),
-            "ev_ebitda": AlphaFactor(
-                name="ev_ebitda",
-                description="Enterprise Value to EBITDA",
-                category="value",
-            ),
-
-            # Quality factors
-            "roe": AlphaFactor(
-                name="roe",
-                description="Return on Equity",
-                category="quality",
-            ),
-            "roa": AlphaFactor(
-                name="roa",
-                description="Return on Assets",
-                category="quality",
-            ),
-            "gross_margin": AlphaFactor(
-                name="gross_margin",
-                description="Gross profit margin",
-                category="quality",
-            ),
-            "debt_to_equity": AlphaFactor(
-                name="debt_to_equity",
-                description="Debt to Equity ratio",
-                category="quality",
-            ),
-            "current_ratio": AlphaFactor(
-                name="current_ratio",
-                description="Current ratio",
-                category="quality",
-            ),
-
-            # Volatility factors
-            "volatility_20d": AlphaFactor(
-                name="volatility_20d",
-                description="20-day realized volatility",
-                category="volatility",
-            ),
-            "volatility_60d": AlphaFactor(
-                name="volatility_60d",
-                description="60-day realized volatility",
-                category="volatility",
-            ),
-            "max_drawdown_1m": AlphaFactor(
-                name="max_drawdown_1m",
-                description="1-month maximum drawdown",
-                category="volatility",
-            ),
-            "beta": AlphaFactor(
-                name="beta",
-                description="Market beta",
-                category="volatility",
-            ),
-
-            # Liquidity factors
-            "avg_volume": AlphaFactor(
-                name="avg_volume",
-                description="Average trading volume",
-                category="liquidity",
-            ),
-            "volume_volatility": AlphaFactor(
-                name="volume_volatility",
-                description="Volume volatility",
-                category="liquidity",
-            ),
-            "turnover": AlphaFactor(
-                name="turnover",
-                description="Share turnover ratio",
-                category="liquidity",
-            ),
-
-            # Technical factors
-            "sma_ratio": AlphaFactor(
-                name="sma_ratio",
-                description="Price to Simple Moving Average ratio",
-                category="technical",
-            ),
-            "bb_position": AlphaFactor(
-                name="bb_position",
-                description="Bollinger Bands position",
-                category="technical",
-            ),
-            "atr": AlphaFactor(
-                name="atr",
-                description="Average True Range",
-                category="technical",
-            ),
-        }
+        self.factors = _FACTORS
 
+    @cached_indicator(maxsize=64)
     def calculate_technical_factors(
         self,
         prices: pd.DataFrame,
-        volumes: pd.DataFrame
+        volumes: pd.DataFrame,
+        dtype: np.dtype = np.float32
     ) -> pd.DataFrame:
         """
         Calculate technical factors from price and volume data.
@@ -174,33 +272,57 @@ class FactorEngine:
         Args:
             prices: DataFrame with price data (OHLC)
             volumes: DataFrame with volume data
+            dtype: Storage dtype of the returned factors. Running sums are
+                always accumulated in float64 and only cast on store.
 
         Returns:
             DataFrame with calculated factors
         """
-        factors = pd.DataFrame(index=prices.index)
+        high, low, close = _price_arrays(prices)
+        volume = _volume_values(volumes, prices.index)
 
-        # Momentum factors
-        factors["momentum_1m"] = self._calculate_momentum(prices, 20)
-        factors["momentum_3m"] = self._calculate_momentum(prices, 60)
-        factors["momentum_12m"] = self._calculate_momentum(prices, 240, offset=20)
-        factors["rsi"] = self._calculate_rsi(prices, 14)
-        factors["macd"] = self._calculate_macd(prices)
+        # All factors are produced by one streaming pass over the inputs
+        out = np.empty((len(close), len(kernels.FACTOR_COLUMNS)), dtype=dtype)
+        kernels.compute_all_factors(close, high, low, volume, out)
 
-        # Volatility factors
-        factors["volatility_20d"] = self._calculate_volatility(prices, 20)
-        factors["volatility_60d"] = self._calculate_volatility(prices, 60)
-        factors["max_drawdown_1m"] = self._calculate_max_drawdown(prices, 20)
+        return pd.DataFrame(out, index=prices.index, columns=list(kernels.FACTOR_COLUMNS))
 
-        # Technical factors
-        factors["sma_ratio"] = self._calculate_sma_ratio(prices, 20)
-        factors["bb_position"] = self._calculate_bb_position(prices, 20)
-        factors["atr"] = self._calculate_atr(prices, 14)
+    def calculate_technical_factors_batch(
+        self,
+        prices: np.ndarray,
+        volumes: np.ndarray,
+        dtype: np.dtype = np.float32
+    ) -> np.ndarray:
+        """
+        Calculate technical factors for many symbols at once.
+
+        Symbols are processed in parallel by the compiled kernel, so callers
+        should prefer this over looping calculate_technical_factors. Panels
+        of at least factors_gpu.GPU_MIN_CELLS cells run on CUDA when a GPU
+        is available.
+
+        Args:
+            prices: OHLC array shaped (n_symbols, n_time, 4)
+            volumes: Volume array shaped (n_symbols, n_time)
+            dtype: Storage dtype of the returned factors
 
-        # Volume factors
-        factors["volume_sma_ratio"] = volumes / volumes.rolling(20).mean()
+        Returns:
+            Array shaped (n_symbols, n_time, n_factors) with columns in
+            factors_kernels.FACTOR_COLUMNS order
+        """
+        prices = np.ascontiguousarray(prices, dtype=np.float64)
+        volumes = np.ascontiguousarray(volumes, dtype=np.float64)
+        if prices.ndim != 3 or prices.shape[2] != 4:
+            raise ValueError("prices must be shaped (n_symbols, n_time, 4)")
+        if volumes.shape != prices.shape[:2]:
+            raise ValueError("volumes must be shaped (n_symbols, n_time)")
 
-        return factors
+        out = np.empty(prices.shape[:2] + (len(kernels.FACTOR_COLUMNS),), dtype=dtype)
+        if factors_gpu.should_use_gpu(*prices.shape[:2]):
+            factors_gpu.compute_all_factors_batch(prices, volumes, out)
+        else:
+            kernels.compute_all_factors_batch(prices, volumes, out)
+        return out
 
     def _calculate_momentum(
         self,
@@ -216,59 +338,38 @@ class FactorEngine:
 
     def _calculate_rsi(self, prices: pd.DataFrame, period: int = 14) -> pd.Series:
         """Calculate Relative Strength Index."""
-        close = prices["close"] if "close" in prices.columns else prices.iloc[:, -1]
-        delta = close.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-        rs = gain / loss
-        return 100 - (100 / (1 + rs))
+        close = _column_values(prices, "close", -1)
+        return pd.Series(kernels.rsi(close, period), index=prices.index)
 
     def _calculate_macd(self, prices: pd.DataFrame) -> pd.Series:
         """Calculate MACD."""
-        close = prices["close"] if "close" in prices.columns else prices.iloc[:, -1]
-        ema_12 = close.ewm(span=12).mean()
-        ema_26 = close.ewm(span=26).mean()
-        return ema_12 - ema_26
+        close = _column_values(prices, "close", -1)
+        return pd.Series(kernels.macd(close), index=prices.index)
 
     def _calculate_volatility(self, prices: pd.DataFrame, period: int = 20) -> pd.Series:
         """Calculate realized volatility."""
-        close = prices["close"] if "close" in prices.columns else prices.iloc[:, -1]
-        returns = close.pct_change()
-        return returns.rolling(window=period).std() * np.sqrt(252)
+        close = _column_values(prices, "close", -1)
+        return pd.Series(kernels.volatility(close, period), index=prices.index)
 
     def _calculate_max_drawdown(self, prices: pd.DataFrame, period: int = 20) -> pd.Series:
         """Calculate maximum drawdown."""
-        close = prices["close"] if "close" in prices.columns else prices.iloc[:, -1]
-        rolling_max = close.rolling(window=period, min_periods=1).max()
-        drawdown = (close - rolling_max) / rolling_max
-        return drawdown.rolling(window=period, min_periods=1).min()
+        close = _column_values(prices, "close", -1)
+        return pd.Series(kernels.max_drawdown(close, period), index=prices.index)
 
     def _calculate_sma_ratio(self, prices: pd.DataFrame, period: int = 20) -> pd.Series:
         """Calculate price to SMA ratio."""
-        close = prices["close"] if "close" in prices.columns else prices.iloc[:, -1]
-        sma = close.rolling(window=period).mean()
-        return close / sma
+        close = _column_values(prices, "close", -1)
+        return pd.Series(kernels.sma_ratio(close, period), index=prices.index)
 
     def _calculate_bb_position(self, prices: pd.DataFrame, period: int = 20) -> pd.Series:
         """Calculate Bollinger Bands position."""
-        close = prices["close"] if "close" in prices.columns else prices.iloc[:, -1]
-        sma = close.rolling(window=period).mean()
-        std = close.rolling(window=period).std()
-        upper = sma + (std * 2)
-        lower = sma - (std * 2)
-        return (close - lower) / (upper - lower)
+        close = _column_values(prices, "close", -1)
+        return pd.Series(kernels.bb_position(close, period), index=prices.index)
 
     def _calculate_atr(self, prices: pd.DataFrame, period: int = 14) -> pd.Series:
         """Calculate Average True Range."""
-        high = prices["high"] if "high" in prices.columns else prices.iloc[:, 0]
-        low = prices["low"] if "low" in prices.columns else prices.iloc[:, 1]
-        close = prices["close"] if "close" in prices.columns else prices.iloc[:, -1]
-
-        tr1 = high - low
-        tr2 = abs(high - close.shift())
-        tr3 = abs(low - close.shift())
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        return tr.rolling(window=period).mean()
+        high, low, close = _price_arrays(prices)
+        return pd.Series(kernels.atr(high, low, close, period), index=prices.index)
 
     def get_factor_list(self) -> List[str]:
         """Get list of all available factor names."""
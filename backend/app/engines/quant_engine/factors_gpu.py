@@ -0,0 +1,201 @@
+"""
+CUDA path for universe-scale technical factor computation.
+
+Every factor is a recurrence along time (EMA weights, running window sums,
+monotonic drawdown deques), so the parallel axis is the symbol: one GPU
+thread runs the same state machine as factors_kernels.compute_all_factors
+for one symbol. Inputs are laid out time-major, (n_time, n_symbols), so
+neighbouring threads read and write neighbouring addresses at every step.
+
+Only worth the transfer cost for large panels; see GPU_MIN_CELLS.
+"""
+
+import numpy as np
+from loguru import logger
+
+from app.engines.quant_engine import factors_kernels as kernels
+
+try:
+    from numba import cuda
+    CUDA_AVAILABLE = cuda.is_available()
+except ImportError:
+    CUDA_AVAILABLE = False
+
+if not CUDA_AVAILABLE:
+    logger.debug("CUDA not available — batch factors will run on the CPU kernels")
+
+# Below this many (symbol, bar) cells the host/device copies outweigh the win
+GPU_MIN_CELLS = 10_000_000
+
+_THREADS_PER_BLOCK = 128
+_N_FACTORS = len(kernels.FACTOR_COLUMNS)
+_DRAWDOWN_PERIOD = kernels._DRAWDOWN_PERIOD
+
+
+def should_use_gpu(n_symbols: int, n_time: int) -> bool:
+    """Return True if a panel of this size should go to the CUDA kernel."""
+    return CUDA_AVAILABLE and n_symbols * n_time >= GPU_MIN_CELLS
+
+
+if CUDA_AVAILABLE:
+    def _device(func):
+        """Compile a scalar CPU kernel helper as a CUDA device function."""
+        return cuda.jit(device=True)(getattr(func, "py_func", func))
+
+    _slide = _device(kernels._slide)
+    _window_mean = _device(kernels._window_mean)
+    _window_std = _device(kernels._window_std)
+    _lagged = _device(kernels._lagged)
+    _simple_return = _device(kernels._simple_return)
+    _gain_loss = _device(kernels._gain_loss)
+    _true_range = _device(kernels._true_range)
+    _ema_step = _device(kernels._ema_step)
+    _monotonic_update = _device(kernels._monotonic_update)
+
+    @cuda.jit
+    def _factors_kernel(close_t, high_t, low_t, volume_t, drawdowns_t, out):
+        """One thread per symbol; see compute_all_factors for the recurrences."""
+        s = cuda.grid(1)
+        if s >= close_t.shape[1]:
+            return
+        close = close_t[:, s]
+        high = high_t[:, s]
+        low = low_t[:, s]
+        volume = volume_t[:, s]
+        drawdowns = drawdowns_t[:, s]
+
+        close_win = cuda.local.array(3, np.float64)
+        ret_short = cuda.local.array(3, np.float64)
+        ret_long = cuda.local.array(3, np.float64)
+        tr_win = cuda.local.array(3, np.float64)
+        volume_win = cuda.local.array(3, np.float64)
+        ema_fast = cuda.local.array(3, np.float64)
+        ema_slow = cuda.local.array(3, np.float64)
+        peak_buf = cuda.local.array(_DRAWDOWN_PERIOD, np.int64)
+        trough_buf = cuda.local.array(_DRAWDOWN_PERIOD, np.int64)
+        peak_state = cuda.local.array(2, np.int64)
+        trough_state = cuda.local.array(2, np.int64)
+        for k in range(3):
+            close_win[k] = 0.0
+            ret_short[k] = 0.0
+            ret_long[k] = 0.0
+            tr_win[k] = 0.0
+            volume_win[k] = 0.0
+        ema_fast[0] = np.nan
+        ema_fast[1] = 1.0
+        ema_fast[2] = 1.0 - 2.0 / 13.0
+        ema_slow[0] = np.nan
+        ema_slow[1] = 1.0
+        ema_slow[2] = 1.0 - 2.0 / 27.0
+        peak_state[0] = 0
+        peak_state[1] = 0
+        trough_state[0] = 0
+        trough_state[1] = 0
+        gain_sum = 0.0
+        loss_sum = 0.0
+        annualise = 252.0 ** 0.5
+
+        for i in range(close.shape[0]):
+            c = close[i]
+
+            # Momentum
+            lag = _lagged(close, i, kernels._MOMENTUM_1M)
+            out[i, 0, s] = (c - lag) / lag
+            lag = _lagged(close, i, kernels._MOMENTUM_3M)
+            out[i, 1, s] = (c - lag) / lag
+            base = _lagged(close, i, kernels._MOMENTUM_12M + kernels._MOMENTUM_12M_OFFSET)
+            out[i, 2, s] = (_lagged(close, i, kernels._MOMENTUM_12M_OFFSET) - base) / base
+
+            # RSI
+            gain, loss = _gain_loss(close, i)
+            gain_sum += gain
+            loss_sum += loss
+            if i >= kernels._RSI_PERIOD:
+                gain, loss = _gain_loss(close, i - kernels._RSI_PERIOD)
+                gain_sum -= gain
+                loss_sum -= loss
+            rsi = np.nan
+            if i >= kernels._RSI_PERIOD - 1:
+                if loss_sum != 0.0:
+                    rsi = 100.0 - 100.0 / (1.0 + gain_sum / loss_sum)
+                elif gain_sum > 0.0:
+                    rsi = 100.0
+            out[i, 3, s] = rsi
+
+            # MACD
+            out[i, 4, s] = _ema_step(ema_fast, c) - _ema_step(ema_slow, c)
+
+            # Realised volatility
+            r = _simple_return(close, i)
+            old = np.nan
+            if i >= kernels._VOL_SHORT:
+                old = _simple_return(close, i - kernels._VOL_SHORT)
+            _slide(ret_short, r, old)
+            old = np.nan
+            if i >= kernels._VOL_LONG:
+                old = _simple_return(close, i - kernels._VOL_LONG)
+            _slide(ret_long, r, old)
+            out[i, 5, s] = _window_std(ret_short, kernels._VOL_SHORT) * annualise
+            out[i, 6, s] = _window_std(ret_long, kernels._VOL_LONG) * annualise
+
+            # Max drawdown (rolling peak, then rolling trough, min_periods=1)
+            peak = _monotonic_update(close, i, _DRAWDOWN_PERIOD, peak_buf, peak_state, 1.0)
+            drawdowns[i] = np.nan
+            if peak >= 0:
+                drawdowns[i] = (c - close[peak]) / close[peak]
+            trough = _monotonic_update(
+                drawdowns, i, _DRAWDOWN_PERIOD, trough_buf, trough_state, -1.0
+            )
+            out[i, 7, s] = drawdowns[trough] if trough >= 0 else np.nan
+
+            # SMA ratio and Bollinger position (periodic resync as on the CPU)
+            if i % kernels._RESYNC_INTERVAL == 0 and i >= kernels._SMA_PERIOD:
+                for k in range(3):
+                    close_win[k] = 0.0
+                for j in range(i - kernels._SMA_PERIOD + 1, i + 1):
+                    _slide(close_win, close[j], np.nan)
+            else:
+                _slide(close_win, c, _lagged(close, i, kernels._SMA_PERIOD))
+            sma = _window_mean(close_win, kernels._SMA_PERIOD)
+            std = _window_std(close_win, kernels._SMA_PERIOD)
+            out[i, 8, s] = c / sma
+            out[i, 9, s] = (c - (sma - 2.0 * std)) / (4.0 * std)
+
+            # ATR
+            old = np.nan
+            if i >= kernels._ATR_PERIOD:
+                old = _true_range(high, low, close, i - kernels._ATR_PERIOD)
+            _slide(tr_win, _true_range(high, low, close, i), old)
+            out[i, 10, s] = _window_mean(tr_win, kernels._ATR_PERIOD)
+
+            # Volume relative to its moving average
+            _slide(volume_win, volume[i], _lagged(volume, i, kernels._VOLUME_PERIOD))
+            out[i, 11, s] = volume[i] / _window_mean(volume_win, kernels._VOLUME_PERIOD)
+
+
+def compute_all_factors_batch(prices: np.ndarray, volumes: np.ndarray, out: np.ndarray) -> None:
+    """
+    CUDA counterpart of factors_kernels.compute_all_factors_batch.
+
+    Args:
+        prices: float64 OHLC array shaped (n_symbols, n_time, 4)
+        volumes: float64 array shaped (n_symbols, n_time)
+        out: Array shaped (n_symbols, n_time, len(FACTOR_COLUMNS)), filled in place
+    """
+    if not CUDA_AVAILABLE:
+        raise RuntimeError("CUDA is not available")
+    n_symbols, n_time = prices.shape[:2]
+
+    # Time-major device copies so a warp's loads at step i are contiguous
+    close_t = cuda.to_device(np.ascontiguousarray(prices[:, :, 3].T))
+    high_t = cuda.to_device(np.ascontiguousarray(prices[:, :, 1].T))
+    low_t = cuda.to_device(np.ascontiguousarray(prices[:, :, 2].T))
+    volume_t = cuda.to_device(np.ascontiguousarray(volumes.T))
+    drawdowns_t = cuda.device_array((n_time, n_symbols), dtype=np.float64)
+    out_t = cuda.device_array((n_time, _N_FACTORS, n_symbols), dtype=out.dtype)
+
+    blocks = (n_symbols + _THREADS_PER_BLOCK - 1) // _THREADS_PER_BLOCK
+    _factors_kernel[blocks, _THREADS_PER_BLOCK](
+        close_t, high_t, low_t, volume_t, drawdowns_t, out_t
+    )
+    out[...] = out_t.copy_to_host().transpose(2, 0, 1)
@@ -0,0 +1,537 @@
+"""
+Compiled kernels for FactorEngine technical indicators.
+
+Every kernel takes float64 NumPy arrays and returns a NaN-initialised output
+of the same length, matching the pandas rolling semantics FactorEngine used
+before (`min_periods == window` unless noted). Rolling means and standard
+deviations are maintained as running sums, so each pass is O(n) regardless
+of the window length.
+
+Kernels are compiled with numba when it is installed and fall back to plain
+Python execution otherwise.
+"""
+
+import math
+
+import numpy as np
+from loguru import logger
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    logger.warning("numba not installed — factor kernels will run as plain Python")
+
+
+def _njit(func):
+    """Compile `func` with numba if available, otherwise return it unchanged."""
+    if NUMBA_AVAILABLE:
+        return njit(cache=True, nogil=True, error_model="numpy")(func)
+    return func
+
+
+def _njit_parallel(func):
+    """Like `_njit`, but lets `prange` loops run across threads."""
+    if NUMBA_AVAILABLE:
+        return njit(cache=True, nogil=True, parallel=True, error_model="numpy")(func)
+    return func
+
+
+@_njit
+def rolling_mean(x, window):
+    """Rolling mean over `window` observations."""
+    n = x.size
+    out = np.full(n, np.nan)
+    total = 0.0
+    count = 0
+    for i in range(n):
+        v = x[i]
+        if not math.isnan(v):
+            total += v
+            count += 1
+        if i >= window:
+            old = x[i - window]
+            if not math.isnan(old):
+                total -= old
+                count -= 1
+        if count == window:
+            out[i] = total / window
+    return out
+
+
+@_njit
+def rolling_std(x, window):
+    """Rolling sample standard deviation (ddof=1) over `window` observations."""
+    n = x.size
+    out = np.full(n, np.nan)
+    total = 0.0
+    total_sq = 0.0
+    count = 0
+    for i in range(n):
+        v = x[i]
+        if not math.isnan(v):
+            total += v
+            total_sq += v * v
+            count += 1
+        if i >= window:
+            old = x[i - window]
+            if not math.isnan(old):
+                total -= old
+                total_sq -= old * old
+                count -= 1
+        if count == window and window > 1:
+            var = (total_sq - total * total / window) / (window - 1)
+            out[i] = math.sqrt(var) if var > 0.0 else 0.0
+    return out
+
+
+@_njit
+def ema(x, span):
+    """Exponential moving average with pandas' `adjust=True` weighting."""
+    n = x.size
+    out = np.full(n, np.nan)
+    decay = 1.0 - 2.0 / (span + 1.0)
+    weighted = np.nan
+    old_wt = 1.0
+    for i in range(n):
+        v = x[i]
+        if not math.isnan(weighted):
+            old_wt *= decay
+            if not math.isnan(v):
+                weighted = (old_wt * weighted + v) / (old_wt + 1.0)
+                old_wt += 1.0
+        elif not math.isnan(v):
+            weighted = v
+        out[i] = weighted
+    return out
+
+
+def _cumsum_rolling_mean(x, window):
+    """Rolling mean of a NaN-free array from differences of its cumulative sum."""
+    out = np.full(x.size, np.nan)
+    if x.size >= window:
+        c = np.cumsum(x)
+        out[window - 1] = c[window - 1]
+        out[window:] = c[window:] - c[:-window]
+        out[window - 1:] /= window
+    return out
+
+
+def rsi(close, period):
+    """
+    Relative Strength Index from simple rolling means of gains and losses.
+
+    Fully vectorised: fmax maps the NaN first difference (and any NaN gaps)
+    to zero, matching pandas' `delta.where(delta > 0, 0)`.
+    """
+    d = np.diff(close, prepend=close[:1])
+    avg_gain = _cumsum_rolling_mean(np.fmax(d, 0.0), period)
+    avg_loss = _cumsum_rolling_mean(np.fmax(-d, 0.0), period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+
+@_njit
+def macd(close):
+    """
+    MACD line: EMA(12) - EMA(26).
+
+    Both adjust=True recurrences advance together on scalar locals and write
+    the difference straight into the output, so neither EMA is materialised.
+    """
+    n = close.size
+    out = np.empty(n)
+    fast_decay = 1.0 - 2.0 / 13.0
+    slow_decay = 1.0 - 2.0 / 27.0
+    fast = np.nan
+    slow = np.nan
+    fast_wt = 1.0
+    slow_wt = 1.0
+    for i in range(n):
+        v = close[i]
+        if not math.isnan(fast):
+            fast_wt *= fast_decay
+            slow_wt *= slow_decay
+            if not math.isnan(v):
+                fast = (fast_wt * fast + v) / (fast_wt + 1.0)
+                slow = (slow_wt * slow + v) / (slow_wt + 1.0)
+                fast_wt += 1.0
+                slow_wt += 1.0
+        elif not math.isnan(v):
+            fast = v
+            slow = v
+        out[i] = fast - slow
+    return out
+
+
+@_njit
+def volatility(close, period):
+    """Annualised rolling standard deviation of simple returns."""
+    n = close.size
+    returns = np.full(n, np.nan)
+    for i in range(1, n):
+        returns[i] = close[i] / close[i - 1] - 1.0
+    return rolling_std(returns, period) * math.sqrt(252.0)
+
+
+@_njit
+def _monotonic_update(values, i, period, buf, state, sign):
+    """
+    Slide a monotonic deque of indices to the window ending at `i`.
+
+    `buf` is an int64 ring of capacity `period` and `state` holds its
+    [head, size]. With sign=1 the head tracks the window maximum, with
+    sign=-1 the minimum. NaNs are skipped; returns the head index or -1 when
+    the window holds no values. Amortised O(1) per call.
+    """
+    head = state[0]
+    size = state[1]
+    while size > 0 and buf[head] <= i - period:
+        head = (head + 1) % period
+        size -= 1
+    v = values[i]
+    if not math.isnan(v):
+        while size > 0 and sign * v >= sign * values[buf[(head + size - 1) % period]]:
+            size -= 1
+        buf[(head + size) % period] = i
+        size += 1
+    state[0] = head
+    state[1] = size
+    return buf[head] if size > 0 else -1
+
+
+@_njit
+def _drawdown_step(close, drawdowns, i, period, peak_buf, peak_state, trough_buf, trough_state):
+    """Write drawdowns[i] and return the rolling trough of drawdowns ending at i."""
+    peak = _monotonic_update(close, i, period, peak_buf, peak_state, 1.0)
+    drawdowns[i] = (close[i] - close[peak]) / close[peak] if peak >= 0 else np.nan
+    trough = _monotonic_update(drawdowns, i, period, trough_buf, trough_state, -1.0)
+    return drawdowns[trough] if trough >= 0 else np.nan
+
+
+@_njit
+def max_drawdown(close, period):
+    """Rolling minimum of the drawdown from the rolling maximum (min_periods=1)."""
+    n = close.size
+    out = np.full(n, np.nan)
+    drawdowns = np.empty(n)
+    peak_buf = np.empty(period, dtype=np.int64)
+    trough_buf = np.empty(period, dtype=np.int64)
+    peak_state = np.zeros(2, dtype=np.int64)
+    trough_state = np.zeros(2, dtype=np.int64)
+    for i in range(n):
+        out[i] = _drawdown_step(
+            close, drawdowns, i, period, peak_buf, peak_state, trough_buf, trough_state
+        )
+    return out
+
+
+@_njit
+def sma_ratio(close, period):
+    """Price relative to its simple moving average."""
+    return close / rolling_mean(close, period)
+
+
+@_njit
+def bb_position(close, period):
+    """
+    Position of the price inside 2-sigma Bollinger Bands (0 = lower, 1 = upper).
+
+    Mean and sample std come from one running sum / sum-of-squares window.
+    Every _RESYNC_INTERVAL bars the sums are rebuilt from the window itself so
+    cancellation error from the add/subtract updates cannot accumulate.
+    """
+    n = close.size
+    out = np.empty(n)
+    window = np.zeros(3)
+    for i in range(n):
+        if i % _RESYNC_INTERVAL == 0 and i >= period:
+            _resync(window, close, i - period + 1, i + 1)
+        else:
+            _slide(window, close[i], _lagged(close, i, period))
+        sma = _window_mean(window, period)
+        std = _window_std(window, period)
+        out[i] = (close[i] - (sma - 2.0 * std)) / (4.0 * std)
+    return out
+
+
+@_njit
+def atr(high, low, close, period):
+    """
+    Average True Range.
+
+    The true range is a scalar recomputed for the bar entering and the bar
+    leaving the window, so no true-range series is materialised.
+    """
+    n = close.size
+    out = np.empty(n)
+    window = np.zeros(3)
+    for i in range(n):
+        _slide(
+            window,
+            _true_range(high, low, close, i),
+            _true_range(high, low, close, i - period) if i >= period else np.nan,
+        )
+        out[i] = _window_mean(window, period)
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Fused single-pass kernel
+# ---------------------------------------------------------------------------
+# Column layout written by compute_all_factors, in FactorEngine order.
+FACTOR_COLUMNS = (
+    "momentum_1m",
+    "momentum_3m",
+    "momentum_12m",
+    "rsi",
+    "macd",
+    "volatility_20d",
+    "volatility_60d",
+    "max_drawdown_1m",
+    "sma_ratio",
+    "bb_position",
+    "atr",
+    "volume_sma_ratio",
+)
+
+_MOMENTUM_1M = 20
+_MOMENTUM_3M = 60
+_MOMENTUM_12M = 240
+_MOMENTUM_12M_OFFSET = 20
+_RSI_PERIOD = 14
+_VOL_SHORT = 20
+_VOL_LONG = 60
+_DRAWDOWN_PERIOD = 20
+_SMA_PERIOD = 20
+_ATR_PERIOD = 14
+_VOLUME_PERIOD = 20
+# Bars between full recomputes of running window sums
+_RESYNC_INTERVAL = 10_000
+
+
+@_njit
+def _slide(state, new, old):
+    """Update a [sum, sum_sq, count] window state with one entering/leaving value."""
+    if not math.isnan(new):
+        state[0] += new
+        state[1] += new * new
+        state[2] += 1.0
+    if not math.isnan(old):
+        state[0] -= old
+        state[1] -= old * old
+        state[2] -= 1.0
+
+
+@_njit
+def _resync(state, x, start, stop):
+    """Recompute a [sum, sum_sq, count] window state from x[start:stop]."""
+    state[0] = 0.0
+    state[1] = 0.0
+    state[2] = 0.0
+    for j in range(start, stop):
+        _slide(state, x[j], np.nan)
+
+
+@_njit
+def _window_mean(state, window):
+    if state[2] == window:
+        return state[0] / window
+    return np.nan
+
+
+@_njit
+def _window_std(state, window):
+    if state[2] == window and window > 1:
+        var = (state[1] - state[0] * state[0] / window) / (window - 1)
+        return math.sqrt(var) if var > 0.0 else 0.0
+    return np.nan
+
+
+@_njit
+def _lagged(x, i, lag):
+    return x[i - lag] if i >= lag else np.nan
+
+
+@_njit
+def _simple_return(close, i):
+    if i < 1:
+        return np.nan
+    return close[i] / close[i - 1] - 1.0
+
+
+@_njit
+def _gain_loss(close, i):
+    if i < 1:
+        return 0.0, 0.0
+    # Branchless split: the NaN guard and both clamps lower to selects /
+    # maxsd rather than sign-dependent jumps on unpredictable returns.
+    d = close[i] - close[i - 1]
+    d = 0.0 if math.isnan(d) else d
+    return max(d, 0.0), max(-d, 0.0)
+
+
+@_njit
+def _true_range(high, low, close, i):
+    best = high[i] - low[i]
+    if i > 0:
+        prev_close = close[i - 1]
+        up = abs(high[i] - prev_close)
+        down = abs(low[i] - prev_close)
+        if math.isnan(best) or up > best:
+            best = up
+        if math.isnan(best) or down > best:
+            best = down
+    return best
+
+
+@_njit
+def _ema_step(state, v):
+    """Advance an adjust=True EMA held as [weighted, old_wt, decay]."""
+    if not math.isnan(state[0]):
+        state[1] *= state[2]
+        if not math.isnan(v):
+            state[0] = (state[1] * state[0] + v) / (state[1] + 1.0)
+            state[1] += 1.0
+    elif not math.isnan(v):
+        state[0] = v
+    return state[0]
+
+
+@_njit
+def compute_all_factors(close, high, low, volume, out):
+    """
+    Stream close/high/low/volume once and fill every technical factor.
+
+    `out` must have shape (n, len(FACTOR_COLUMNS)); each row is written in
+    full, so it can be allocated with np.empty. Window state is held in
+    float64 whatever the dtype of `out`, which may be float32 for storage.
+    """
+    n = close.size
+
+    close_win = np.zeros(3)
+    ret_short = np.zeros(3)
+    ret_long = np.zeros(3)
+    tr_win = np.zeros(3)
+    volume_win = np.zeros(3)
+    gain_sum = 0.0
+    loss_sum = 0.0
+    ema_fast = np.array([np.nan, 1.0, 1.0 - 2.0 / 13.0])
+    ema_slow = np.array([np.nan, 1.0, 1.0 - 2.0 / 27.0])
+    drawdowns = np.empty(n)
+    peak_buf = np.empty(_DRAWDOWN_PERIOD, dtype=np.int64)
+    trough_buf = np.empty(_DRAWDOWN_PERIOD, dtype=np.int64)
+    peak_state = np.zeros(2, dtype=np.int64)
+    trough_state = np.zeros(2, dtype=np.int64)
+
+    for i in range(n):
+        c = close[i]
+
+        # Momentum
+        out[i, 0] = (c - _lagged(close, i, _MOMENTUM_1M)) / _lagged(close, i, _MOMENTUM_1M)
+        out[i, 1] = (c - _lagged(close, i, _MOMENTUM_3M)) / _lagged(close, i, _MOMENTUM_3M)
+        base = _lagged(close, i, _MOMENTUM_12M + _MOMENTUM_12M_OFFSET)
+        out[i, 2] = (_lagged(close, i, _MOMENTUM_12M_OFFSET) - base) / base
+
+        # RSI
+        gain, loss = _gain_loss(close, i)
+        gain_sum += gain
+        loss_sum += loss
+        if i >= _RSI_PERIOD:
+            gain, loss = _gain_loss(close, i - _RSI_PERIOD)
+            gain_sum -= gain
+            loss_sum -= loss
+        if i >= _RSI_PERIOD - 1:
+            if loss_sum != 0.0:
+                out[i, 3] = 100.0 - 100.0 / (1.0 + gain_sum / loss_sum)
+            elif gain_sum > 0.0:
+                out[i, 3] = 100.0
+            else:
+                out[i, 3] = np.nan
+        else:
+            out[i, 3] = np.nan
+
+        # MACD
+        out[i, 4] = _ema_step(ema_fast, c) - _ema_step(ema_slow, c)
+
+        # Realised volatility
+        r = _simple_return(close, i)
+        _slide(ret_short, r, _simple_return(close, i - _VOL_SHORT) if i >= _VOL_SHORT else np.nan)
+        _slide(ret_long, r, _simple_return(close, i - _VOL_LONG) if i >= _VOL_LONG else np.nan)
+        out[i, 5] = _window_std(ret_short, _VOL_SHORT) * math.sqrt(252.0)
+        out[i, 6] = _window_std(ret_long, _VOL_LONG) * math.sqrt(252.0)
+
+        # Max drawdown (rolling peak, then rolling trough, min_periods=1)
+        out[i, 7] = _drawdown_step(
+            close, drawdowns, i, _DRAWDOWN_PERIOD,
+            peak_buf, peak_state, trough_buf, trough_state,
+        )
+
+        # SMA ratio and Bollinger position (sums rebuilt periodically, as in bb_position)
+        if i % _RESYNC_INTERVAL == 0 and i >= _SMA_PERIOD:
+            _resync(close_win, close, i - _SMA_PERIOD + 1, i + 1)
+        else:
+            _slide(close_win, c, _lagged(close, i, _SMA_PERIOD))
+        sma = _window_mean(close_win, _SMA_PERIOD)
+        std = _window_std(close_win, _SMA_PERIOD)
+        out[i, 8] = c / sma
+        out[i, 9] = (c - (sma - 2.0 * std)) / (4.0 * std)
+
+        # ATR
+        _slide(
+            tr_win,
+            _true_range(high, low, close, i),
+            _true_range(high, low, close, i - _ATR_PERIOD) if i >= _ATR_PERIOD else np.nan,
+        )
+        out[i, 10] = _window_mean(tr_win, _ATR_PERIOD)
+
+        # Volume relative to its moving average
+        _slide(volume_win, volume[i], _lagged(volume, i, _VOLUME_PERIOD))
+        out[i, 11] = volume[i] / _window_mean(volume_win, _VOLUME_PERIOD)
+
+
+@_njit_parallel
+def compute_all_factors_batch(prices, volumes, out):
+    """
+    Run compute_all_factors for every symbol of an OHLC panel in parallel.
+
+    `prices` is (n_symbols, n_time, 4) in open/high/low/close order,
+    `volumes` is (n_symbols, n_time) and `out` is
+    (n_symbols, n_time, len(FACTOR_COLUMNS)).
+    """
+    for s in prange(prices.shape[0]):
+        compute_all_factors(prices[s, :, 3], prices[s, :, 1], prices[s, :, 2], volumes[s], out[s])
+
+
+def warmup(n: int = 64) -> None:
+    """
+    Compile every kernel for the argument types FactorEngine passes in.
+
+    numba compiles lazily, so without this the first request that computes
+    factors pays the JIT cost. Together with cache=True, later processes only
+    load the compiled code from disk.
+
+    Args:
+        n: Length of the dummy series used to trigger compilation
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    x = np.linspace(1.0, 2.0, n)
+    rolling_mean(x, 2)
+    rolling_std(x, 2)
+    ema(x, 2)
+    macd(x)
+    volatility(x, 2)
+    max_drawdown(x, 2)
+    sma_ratio(x, 2)
+    bb_position(x, 2)
+    atr(x, x, x, 2)
+    for dtype in (np.float32, np.float64):
+        compute_all_factors(x, x, x, x, np.empty((n, len(FACTOR_COLUMNS)), dtype=dtype))
+        compute_all_factors_batch(
+            np.ones((2, n, 4)),
+            np.ones((2, n)),
+            np.empty((2, n, len(FACTOR_COLUMNS)), dtype=dtype),
+        )
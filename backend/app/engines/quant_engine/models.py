@@ -2,6 +2,39 @@ from enum import Enum
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 
+import numpy as np
+
+
+# Structured layouts for the BacktestResult time series. Field names match the
+# keys of the JSON records returned by BacktestResult.to_dict().
+EQUITY_CURVE_DTYPE = np.dtype([("date", "datetime64[D]"), ("value", "f8")])
+MONTHLY_RETURNS_DTYPE = np.dtype([("month", "datetime64[M]"), ("return", "f8")])
+DRAWDOWN_SERIES_DTYPE = np.dtype([("date", "datetime64[D]"), ("drawdown", "f8")])
+
+
+def records_from_structured(series: np.ndarray) -> List[Dict[str, Any]]:
+    """
+    Convert a structured array into a list of JSON-ready dicts.
+
+    Datetime fields become ISO strings at the array's own resolution
+    ("2024-01-31" for days, "2024-01" for months); numeric fields become
+    Python floats.
+
+    Args:
+        series: Structured array, e.g. BacktestResult.equity_curve
+
+    Returns:
+        One dict per element, keyed by field name
+    """
+    names = series.dtype.names
+    columns = [
+        np.datetime_as_string(series[name]).tolist()
+        if np.issubdtype(series.dtype[name], np.datetime64)
+        else series[name].tolist()
+        for name in names
+    ]
+    return [dict(zip(names, row)) for row in zip(*columns)]
+
 
 class ModelType(str, Enum):
     """Available deep learning model types."""
@@ -16,7 +49,7 @@ class ModelType(str, Enum):
     STGNN = "stgnn"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModelConfig:
     """Configuration for a deep learning model."""
     model_type: ModelType
@@ -32,7 +65,7 @@ class ModelConfig:
     early_stopping_patience: int = 10
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PredictionResult:
     """Result from a prediction model."""
     symbol: str
@@ -45,7 +78,7 @@ class PredictionResult:
     prediction_horizon: int = 5
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SignalResult:
     """Complete signal generation result."""
     predictions: Dict[str, PredictionResult]
@@ -55,7 +88,7 @@ class SignalResult:
     model_metadata: Dict[str, Any]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BacktestResult:
     """Backtest simulation result."""
     total_return: float
@@ -70,13 +103,20 @@ class BacktestResult:
     profit_factor: float
     trades_count: int
     avg_trade_return: float
-    equity_curve: List[Dict[str, Any]]
-    monthly_returns: List[Dict[str, Any]]
-    drawdown_series: List[Dict[str, Any]]
+    equity_curve: np.ndarray  # EQUITY_CURVE_DTYPE
+    monthly_returns: np.ndarray  # MONTHLY_RETURNS_DTYPE
+    drawdown_series: np.ndarray  # DRAWDOWN_SERIES_DTYPE
     trade_history: List[Dict[str, Any]]
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to plain JSON types, expanding the series into records."""
+        data = {name: getattr(self, name) for name in self.__dataclass_fields__}
+        for name in ("equity_curve", "monthly_returns", "drawdown_series"):
+            data[name] = records_from_structured(data[name])
+        return data
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FactorExposure:
     """Factor exposure analysis."""
     portfolio_id: int
@@ -0,0 +1,280 @@
+"""
+Incremental technical factors for live ticks.
+
+StreamingFactorEngine keeps the rolling state behind every factor produced by
+FactorEngine.calculate_technical_factors (running window sums, EMA weights,
+RSI gain/loss sums, monotonic drawdown deques) and advances it by one bar per
+update, so each tick costs O(1) instead of recomputing the whole history.
+Values match the last row of the batch calculation on the same bars.
+
+When the optional native extension built from backend/factors_rs is
+installed, the same state machine runs in Rust and update() is a single call.
+"""
+
+import math
+from collections import deque
+from typing import Dict, Optional
+
+from loguru import logger
+
+from app.engines.quant_engine import factors_kernels as kernels
+
+try:
+    from ai_auto_investment_factors_rs import StreamingFactorEngineRs
+    NATIVE_AVAILABLE = True
+except ImportError:
+    NATIVE_AVAILABLE = False
+    logger.debug("ai_auto_investment_factors_rs not installed — streaming factors run in Python")
+
+_NAN = float("nan")
+
+
+def _div(a: float, b: float) -> float:
+    """IEEE-style division on Python floats (no ZeroDivisionError)."""
+    if b == 0.0:
+        if a == 0.0 or math.isnan(a):
+            return _NAN
+        return math.copysign(math.inf, a)
+    return a / b
+
+
+class _Window:
+    """Fixed-length ring buffer with running sum and sum of squares."""
+
+    __slots__ = ("size", "ring", "pos", "total", "total_sq", "count")
+
+    def __init__(self, size: int):
+        self.size = size
+        self.ring = [_NAN] * size
+        self.pos = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.count = 0
+
+    def push(self, value: float) -> None:
+        # Add before removing, in the same order as factors_kernels._slide,
+        # so the running sums round identically to the batch kernels
+        old = self.ring[self.pos]
+        if not math.isnan(value):
+            self.total += value
+            self.total_sq += value * value
+            self.count += 1
+        if not math.isnan(old):
+            self.total -= old
+            self.total_sq -= old * old
+            self.count -= 1
+        self.ring[self.pos] = value
+        self.pos = (self.pos + 1) % self.size
+
+    def resync(self) -> None:
+        """Rebuild the running sums from the ring, oldest value first."""
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.count = 0
+        for k in range(self.size):
+            value = self.ring[(self.pos + k) % self.size]
+            if not math.isnan(value):
+                self.total += value
+                self.total_sq += value * value
+                self.count += 1
+
+    def mean(self) -> float:
+        return self.total / self.size if self.count == self.size else _NAN
+
+    def std(self) -> float:
+        if self.count != self.size or self.size < 2:
+            return _NAN
+        var = (self.total_sq - self.total * self.total / self.size) / (self.size - 1)
+        return math.sqrt(var) if var > 0.0 else 0.0
+
+
+class _Ema:
+    """Exponential moving average with pandas' adjust=True weighting."""
+
+    __slots__ = ("decay", "value", "old_wt")
+
+    def __init__(self, span: int):
+        self.decay = 1.0 - 2.0 / (span + 1.0)
+        self.value = _NAN
+        self.old_wt = 1.0
+
+    def push(self, x: float) -> float:
+        if not math.isnan(self.value):
+            self.old_wt *= self.decay
+            if not math.isnan(x):
+                self.value = (self.old_wt * self.value + x) / (self.old_wt + 1.0)
+                self.old_wt += 1.0
+        elif not math.isnan(x):
+            self.value = x
+        return self.value
+
+
+class _MonotonicWindow:
+    """Rolling max (sign=1) or min (sign=-1) over `period` ticks, skipping NaNs."""
+
+    __slots__ = ("period", "sign", "items")
+
+    def __init__(self, period: int, sign: float):
+        self.period = period
+        self.sign = sign
+        self.items: deque = deque()
+
+    def push(self, tick: int, value: float) -> float:
+        items = self.items
+        while items and items[0][0] <= tick - self.period:
+            items.popleft()
+        if not math.isnan(value):
+            while items and self.sign * value >= self.sign * items[-1][1]:
+                items.pop()
+            items.append((tick, value))
+        return items[0][1] if items else _NAN
+
+
+class StreamingFactorEngine:
+    """
+    O(1)-per-tick counterpart of FactorEngine.calculate_technical_factors.
+
+    Keep one instance per symbol and call update() with each new bar.
+
+    Args:
+        use_native: Run on the Rust extension. Defaults to using it whenever
+            it is installed.
+    """
+
+    def __init__(self, use_native: Optional[bool] = None):
+        if use_native is None:
+            use_native = NATIVE_AVAILABLE
+        elif use_native and not NATIVE_AVAILABLE:
+            raise ImportError("ai_auto_investment_factors_rs is not installed")
+        self._native = StreamingFactorEngineRs() if use_native else None
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all accumulated state."""
+        if self._native is not None:
+            self._native.reset()
+            return
+        max_lag = kernels._MOMENTUM_12M + kernels._MOMENTUM_12M_OFFSET
+        self._tick = -1
+        self._closes = [_NAN] * (max_lag + 1)
+        self._prev_close = _NAN
+        self._gains = _Window(kernels._RSI_PERIOD)
+        self._losses = _Window(kernels._RSI_PERIOD)
+        self._ema_fast = _Ema(12)
+        self._ema_slow = _Ema(26)
+        self._returns_short = _Window(kernels._VOL_SHORT)
+        self._returns_long = _Window(kernels._VOL_LONG)
+        self._peak = _MonotonicWindow(kernels._DRAWDOWN_PERIOD, 1.0)
+        self._trough = _MonotonicWindow(kernels._DRAWDOWN_PERIOD, -1.0)
+        self._close_window = _Window(kernels._SMA_PERIOD)
+        self._true_range = _Window(kernels._ATR_PERIOD)
+        self._volume_window = _Window(kernels._VOLUME_PERIOD)
+
+    def _lagged_close(self, lag: int) -> float:
+        if self._tick < lag:
+            return _NAN
+        return self._closes[(self._tick - lag) % len(self._closes)]
+
+    def update(
+        self,
+        open_: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float
+    ) -> Dict[str, float]:
+        """
+        Advance every factor by one bar.
+
+        Args:
+            open_: Bar open (unused by the current factor set)
+            high: Bar high
+            low: Bar low
+            close: Bar close
+            volume: Bar volume
+
+        Returns:
+            Factor values for this bar, keyed like FACTOR_COLUMNS
+        """
+        if self._native is not None:
+            values = self._native.update(float(high), float(low), float(close), float(volume))
+            return dict(zip(kernels.FACTOR_COLUMNS, values))
+
+        self._tick += 1
+        tick = self._tick
+        close = float(close)
+        high = float(high)
+        low = float(low)
+        volume = float(volume)
+        self._closes[tick % len(self._closes)] = close
+        prev_close = self._prev_close
+        self._prev_close = close
+
+        # Momentum
+        lag_1m = self._lagged_close(kernels._MOMENTUM_1M)
+        lag_3m = self._lagged_close(kernels._MOMENTUM_3M)
+        lag_12m = self._lagged_close(kernels._MOMENTUM_12M + kernels._MOMENTUM_12M_OFFSET)
+        lag_offset = self._lagged_close(kernels._MOMENTUM_12M_OFFSET)
+
+        # RSI (NaN deltas count as neither gain nor loss)
+        delta = close - prev_close if tick > 0 else 0.0
+        self._gains.push(delta if delta > 0.0 else 0.0)
+        self._losses.push(-delta if delta < 0.0 else 0.0)
+        if tick >= kernels._RSI_PERIOD - 1:
+            gain_sum, loss_sum = self._gains.total, self._losses.total
+            if loss_sum != 0.0:
+                rsi = 100.0 - 100.0 / (1.0 + gain_sum / loss_sum)
+            else:
+                rsi = 100.0 if gain_sum > 0.0 else _NAN
+        else:
+            rsi = _NAN
+
+        # MACD
+        macd = self._ema_fast.push(close) - self._ema_slow.push(close)
+
+        # Realised volatility
+        ret = _div(close, prev_close) - 1.0 if tick > 0 else _NAN
+        self._returns_short.push(ret)
+        self._returns_long.push(ret)
+        annualise = math.sqrt(252.0)
+
+        # Max drawdown
+        peak = self._peak.push(tick, close)
+        drawdown = _div(close - peak, peak)
+        trough = self._trough.push(tick, drawdown)
+
+        # SMA ratio and Bollinger position
+        self._close_window.push(close)
+        if tick % kernels._RESYNC_INTERVAL == 0 and tick >= kernels._SMA_PERIOD:
+            self._close_window.resync()
+        sma = self._close_window.mean()
+        std = self._close_window.std()
+
+        # ATR
+        true_range = high - low
+        if tick > 0:
+            up = abs(high - prev_close)
+            down = abs(low - prev_close)
+            if math.isnan(true_range) or up > true_range:
+                true_range = up
+            if math.isnan(true_range) or down > true_range:
+                true_range = down
+        self._true_range.push(true_range)
+
+        # Volume
+        self._volume_window.push(volume)
+
+        return {
+            "momentum_1m": _div(close - lag_1m, lag_1m),
+            "momentum_3m": _div(close - lag_3m, lag_3m),
+            "momentum_12m": _div(lag_offset - lag_12m, lag_12m),
+            "rsi": rsi,
+            "macd": macd,
+            "volatility_20d": self._returns_short.std() * annualise,
+            "volatility_60d": self._returns_long.std() * annualise,
+            "max_drawdown_1m": trough,
+            "sma_ratio": _div(close, sma),
+            "bb_position": _div(close - (sma - 2.0 * std), 4.0 * std),
+            "atr": self._true_range.mean(),
+            "volume_sma_ratio": _div(volume, self._volume_window.mean()),
+        }
@@ -5,15 +5,19 @@ try:
 except Exception:
     pass
 
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 # Import routers
 from app.routers import gemini
 from app.api.routes import router
 from app.core.config import get_settings
+from app.engines.quant_engine import factors_kernels
+from app.services.market_data import create_http_client, market_data_service
 from app.routers import backtest
 from app.routers import stream
 from app.routers import model
@@ -27,7 +31,17 @@ async def lifespan(app: FastAPI):
     """Application lifespan events."""
     # Startup
     print(f"Starting {settings.app_name} in {settings.environment} mode")
-    yield
+    # Compile the factor kernels now rather than on the first factor request
+    await asyncio.to_thread(factors_kernels.warmup)
+    # One HTTP connection pool for the process, opened here and closed on shutdown
+    async with create_http_client() as http:
+        app.state.http = http
+        await market_data_service.use_http_client(http)
+        market_data_service.start_index_refresh()
+        try:
+            yield
+        finally:
+            await market_data_service.stop_index_refresh()
     # Shutdown
     print(f"Shutting down {settings.app_name}")
 
@@ -37,6 +51,7 @@ app = FastAPI(
     description="AI-powered auto-investment platform with deep learning models",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs" if settings.is_development else None,
     redoc_url="/redoc" if settings.is_development else None,
 )
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import Float, ForeignKey, Integer, String, Text, DateTime
+from sqlalchemy import Float, ForeignKey, Index, Integer, String, Text, DateTime
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -56,10 +56,13 @@ class Portfolio(Base):
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="portfolios")
+    # Not loaded implicitly: callers that need holdings must opt in with
+    # selectinload(Portfolio.holdings), otherwise access raises instead of
+    # issuing one query per portfolio.
     holdings: Mapped[List["PortfolioHolding"]] = relationship(
         "PortfolioHolding",
         back_populates="portfolio",
-        lazy="selectin",
+        lazy="raise_on_sql",
         cascade="all, delete-orphan",
     )
     transactions: Mapped[List["PortfolioTransaction"]] = relationship(
@@ -82,6 +85,9 @@ class Portfolio(Base):
 
 class PortfolioHolding(Base):
     __tablename__ = "portfolio_holdings"
+    __table_args__ = (
+        Index("ix_holdings_portfolio_symbol", "portfolio_id", "symbol"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     portfolio_id: Mapped[int] = mapped_column(
@@ -36,7 +36,7 @@ class User(Base):
 
     # Relationships
     portfolios: Mapped[List["Portfolio"]] = relationship(
-        "Portfolio", back_populates="user", lazy="selectin"
+        "Portfolio", back_populates="user", lazy="raise_on_sql"
     )
     wallet: Mapped[Optional["Wallet"]] = relationship(
         "Wallet", back_populates="user", uselist=False, lazy="selectin"
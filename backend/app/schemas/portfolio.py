@@ -19,6 +19,7 @@ class PortfolioHoldingCreate(PortfolioHoldingBase):
 
 
 class PortfolioHoldingResponse(PortfolioHoldingBase):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
     id: int
     portfolio_id: int
     current_price: float
@@ -27,9 +28,6 @@ class PortfolioHoldingResponse(PortfolioHoldingBase):
     confidence_score: Optional[float] = None
     signal_strength: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
 
 # Portfolio Schemas
 class PortfolioBase(BaseModel):
@@ -55,7 +53,7 @@ class PortfolioUpdate(BaseModel):
 
 
 class PortfolioResponse(PortfolioBase):
-    model_config = ConfigDict(from_attributes=True, protected_namespaces=())
+    model_config = ConfigDict(from_attributes=True, frozen=True, protected_namespaces=())
     id: int
     user_id: int
     risk_profile: str
@@ -113,6 +111,7 @@ class RebalanceRecommendation(BaseModel):
 
 # Portfolio Transaction Schema
 class PortfolioTransactionResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
     id: int
     portfolio_id: int
     transaction_type: str
@@ -123,9 +122,6 @@ class PortfolioTransactionResponse(BaseModel):
     description: Optional[str] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # Investment Request Schema (for creating portfolio from wallet)
 class InvestmentRequest(BaseModel):
@@ -150,7 +146,7 @@ class InvestmentResponse(BaseModel):
 
 # System Stats Schema
 class SystemStats(BaseModel):
-    model_config = ConfigDict(from_attributes=True, protected_namespaces=())
+    model_config = ConfigDict(from_attributes=True, frozen=True, protected_namespaces=())
     assets_analyzed: int = Field(
         default=0, description="Total number of assets in database"
     )
@@ -1,7 +1,7 @@
 import re
 from typing import TYPE_CHECKING, List, Optional
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 
 if TYPE_CHECKING:
     from app.schemas.portfolio import PortfolioResponse
@@ -60,14 +60,12 @@ class UserUpdate(BaseModel):
 
 
 class UserInDB(UserBase):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
     id: int
     is_active: bool
     is_superuser: bool
     is_verified: bool = False
 
-    class Config:
-        from_attributes = True
-
 
 class UserResponse(UserInDB):
     pass
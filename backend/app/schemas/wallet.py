@@ -1,6 +1,6 @@
 from typing import List, Optional
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from app.models.wallet import TransactionType, TransactionStatus
 
 
@@ -18,6 +18,7 @@ class WalletUpdate(BaseModel):
 
 
 class WalletInDB(WalletBase):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
     id: int
     user_id: int
     total_deposited: float
@@ -26,9 +27,6 @@ class WalletInDB(WalletBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class WalletResponse(WalletInDB):
     pass
@@ -49,6 +47,7 @@ class TransactionCreate(TransactionBase):
 
 
 class TransactionInDB(TransactionBase):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
     id: int
     wallet_id: int
     balance_before: float
@@ -57,9 +56,6 @@ class TransactionInDB(TransactionBase):
     reference_id: Optional[str]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class TransactionResponse(TransactionInDB):
     pass
@@ -1,6 +1,6 @@
 """Services module for external API integrations and business logic."""
 
-from app.services.market_data import MarketDataService, finnhub_client
+from app.services.market_data import MarketDataService, market_data_service
 from app.services.llm_service import LLMService, llm_service
 
-__all__ = ["MarketDataService", "finnhub_client", "LLMService", "llm_service"]
+__all__ = ["MarketDataService", "market_data_service", "LLMService", "llm_service"]
@@ -446,8 +446,8 @@ async def select_stocks_with_ai(
         try:
             import anthropic
             # Use Sonnet for genuine analytical quality
-            client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
-            msg = client.messages.create(
+            client = anthropic.AsyncAnthropic(api_key=settings.anthropic_api_key)
+            msg = await client.messages.create(
                 model="claude-sonnet-4-6",
                 max_tokens=8000,
                 temperature=0.7,
@@ -1,20 +1,53 @@
 """LLM service for AI-powered portfolio analysis — powered by Anthropic Claude."""
 
+import asyncio
+import hashlib
 import json
-from typing import Dict, List, Optional, Any
+from typing import AsyncGenerator, Awaitable, Callable, Dict, List, Literal, Optional, Any
 from dataclasses import dataclass
 
 import anthropic
+import orjson
 from loguru import logger
+from pydantic import BaseModel, Field, ValidationError, field_validator
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
 
+from app.core.cache import TTLCache, async_cache
 from app.core.config import get_settings
+from app.core.rate_limit import AsyncRateLimiter
 
 settings = get_settings()
 
 _MODEL = "claude-haiku-4-5-20251001"
 
-
-@dataclass
+# Hard bounds on every Claude call so a hung request cannot pin a worker
+_REQUEST_TIMEOUT = 20.0
+_MAX_ATTEMPTS = 3
+_MAX_OUTPUT_TOKENS = 2048
+
+# analyze_stocks packs several symbols into one prompt; the fixed instructions
+# are paid once per batch. Budgets are rough (~4 characters per token).
+_STOCK_BATCH_SIZE = 8
+_STOCK_OUTPUT_TOKENS = 192
+# Floor for any one batch request, so a single-symbol analyze_stock keeps the
+# budget it had before batching
+_MIN_STOCK_BATCH_TOKENS = 512
+_MAX_BATCH_PROMPT_CHARS = 24_000
+
+# Completed responses are reused for identical requests (same prompt, model,
+# temperature, token budget and tool) for this long
+_RESPONSE_CACHE_TTL = 600
+
+# Transient failures worth another attempt; anything else fails fast
+_RETRYABLE_ERRORS = (
+    asyncio.TimeoutError,
+    anthropic.APIConnectionError,  # includes APITimeoutError
+    anthropic.RateLimitError,
+    anthropic.InternalServerError,
+)
+
+
+@dataclass(frozen=True, slots=True)
 class PortfolioAnalysis:
     """AI-generated portfolio analysis."""
     risk_assessment: Dict[str, Any]
@@ -25,7 +58,7 @@ class PortfolioAnalysis:
     summary: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StockAnalysis:
     """AI-generated stock analysis."""
     symbol: str
@@ -36,13 +69,371 @@ class StockAnalysis:
     risk_level: str
 
 
-def _parse_json_from_text(text: str) -> dict:
-    """Extract the first JSON object from a text response."""
-    start = text.find('{')
-    end = text.rfind('}') + 1
-    if start >= 0 and end > start:
-        return json.loads(text[start:end])
-    return json.loads(text)
+# Structured output: analyze_portfolio and analyze_stocks force Claude to call
+# a tool whose input schema is one of these models, so the reply arrives as a
+# parsed object instead of JSON embedded in prose.
+#
+# The schema still advertises the exact enums, but the model sometimes answers
+# with a near miss ("Medium", "B+", "strong_buy"). The before-validators map
+# those onto the allowed values so one loose label doesn't discard the reply.
+_RISK_LEVEL_ALIASES = {
+    "medium": "moderate", "mid": "moderate", "average": "moderate",
+    "very_low": "low", "minimal": "low",
+    "very_high": "high", "elevated": "high",
+}
+_ACTION_ALIASES = {
+    "strong_buy": "buy", "accumulate": "buy", "add": "buy", "increase": "buy",
+    "strong_sell": "sell", "exit": "sell",
+    "trim": "reduce", "decrease": "reduce", "underweight": "reduce",
+    "keep": "hold", "neutral": "hold",
+}
+# Stock signals have no "reduce"; trimming a position reads as a sell
+_SIGNAL_ALIASES = {
+    key: "sell" if action == "reduce" else action for key, action in _ACTION_ALIASES.items()
+} | {"reduce": "sell"}
+
+
+def _normalize_choice(value: Any, aliases: Dict[str, str]) -> Any:
+    """Lowercase an enum label and map known synonyms; anything else passes through."""
+    if not isinstance(value, str):
+        return value
+    key = "_".join(value.strip().lower().replace("-", " ").split())
+    return aliases.get(key, key)
+
+
+class _RiskAssessmentModel(BaseModel):
+    level: Literal["low", "moderate", "high"]
+    score: int = Field(ge=0, le=100)
+    factors: List[str]
+
+    @field_validator("level", mode="before")
+    @classmethod
+    def _normalize_level(cls, value: Any) -> Any:
+        return _normalize_choice(value, _RISK_LEVEL_ALIASES)
+
+
+class _RecommendationModel(BaseModel):
+    action: Literal["buy", "hold", "sell", "reduce"]
+    symbol: str
+    confidence: int = Field(ge=0, le=100)
+    rationale: str
+
+    @field_validator("action", mode="before")
+    @classmethod
+    def _normalize_action(cls, value: Any) -> Any:
+        return _normalize_choice(value, _ACTION_ALIASES)
+
+
+class PortfolioAnalysisModel(BaseModel):
+    """Schema of PortfolioAnalysis as requested from Claude."""
+    risk_assessment: _RiskAssessmentModel
+    diversification_score: int = Field(ge=0, le=100)
+    sector_allocation: Dict[str, float] = Field(description="Percent of portfolio per sector")
+    recommendations: List[_RecommendationModel]
+    overall_rating: Literal["A", "B", "C", "D", "F"]
+    summary: str = Field(description="2-3 sentence summary")
+
+    @field_validator("recommendations", mode="before")
+    @classmethod
+    def _drop_invalid_recommendations(cls, value: Any) -> Any:
+        # Validate per item so one malformed recommendation doesn't discard the analysis
+        if not isinstance(value, list):
+            return value
+        kept = []
+        for item in value:
+            try:
+                kept.append(_RecommendationModel.model_validate(item))
+            except ValidationError as exc:
+                logger.warning("Dropping invalid portfolio recommendation {!r}: {}", item, exc)
+        return kept
+
+    @field_validator("overall_rating", mode="before")
+    @classmethod
+    def _normalize_rating(cls, value: Any) -> Any:
+        # Letter grades with modifiers ("B+", "a-") collapse to the bare letter
+        if isinstance(value, str):
+            return value.strip().rstrip("+-").upper()
+        return value
+
+
+class StockAnalysisModel(BaseModel):
+    """Schema of StockAnalysis as requested from Claude."""
+    symbol: str
+    signal: Literal["buy", "hold", "sell"]
+    confidence: int = Field(ge=0, le=100)
+    rationale: str = Field(description="2-3 sentence explanation")
+    key_factors: List[str]
+    risk_level: Literal["low", "moderate", "high"]
+
+    @field_validator("signal", mode="before")
+    @classmethod
+    def _normalize_signal(cls, value: Any) -> Any:
+        return _normalize_choice(value, _SIGNAL_ALIASES)
+
+    @field_validator("risk_level", mode="before")
+    @classmethod
+    def _normalize_risk_level(cls, value: Any) -> Any:
+        return _normalize_choice(value, _RISK_LEVEL_ALIASES)
+
+
+class _StockAnalysesModel(BaseModel):
+    analyses: List[StockAnalysisModel] = Field(description="One entry per requested stock")
+
+
+def _tool(name: str, description: str, model: type) -> Dict[str, Any]:
+    return {"name": name, "description": description, "input_schema": model.model_json_schema()}
+
+
+_PORTFOLIO_TOOL = _tool(
+    "record_portfolio_analysis", "Record the structured portfolio analysis.", PortfolioAnalysisModel
+)
+_STOCKS_TOOL = _tool(
+    "record_stock_analyses", "Record one investment recommendation per stock.", _StockAnalysesModel
+)
+
+
+def _request_digest(
+    prompt: str, max_tokens: int, temperature: float, tool: Optional[Dict[str, Any]] = None
+) -> str:
+    """Cache key for one completion request."""
+    tool_name = tool["name"] if tool is not None else ""
+    material = "\0".join([_MODEL, repr(temperature), str(max_tokens), tool_name, prompt])
+    return "llm:" + hashlib.blake2b(material.encode(), digest_size=16).hexdigest()
+
+
+def _dumps(obj: Any) -> str:
+    """Compact JSON for prompt payloads; indentation only costs input tokens."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# Prompt templates: the fixed instruction/schema text is built once at import
+# and the per-request payloads are spliced in with str.join.
+_PORTFOLIO_HEADER = """Analyze this investment portfolio and provide structured recommendations.
+
+Portfolio Holdings:
+"""
+_PORTFOLIO_CONTEXT = """
+
+Current Market Context:
+"""
+_PORTFOLIO_RISK = """
+
+Risk Tolerance: """
+_PORTFOLIO_SCHEMA = """
+
+Respond with ONLY valid JSON in exactly this format (no markdown, no extra text):
+{
+    "risk_assessment": {
+        "level": "low|moderate|high",
+        "score": 0-100,
+        "factors": ["factor1", "factor2"]
+    },
+    "diversification_score": 0-100,
+    "sector_allocation": {
+        "technology": 0-100,
+        "healthcare": 0-100,
+        "finance": 0-100,
+        "consumer": 0-100,
+        "energy": 0-100,
+        "other": 0-100
+    },
+    "recommendations": [
+        {
+            "action": "buy|hold|sell|reduce",
+            "symbol": "TICKER",
+            "confidence": 0-100,
+            "rationale": "explanation"
+        }
+    ],
+    "overall_rating": "A|B|C|D|F",
+    "summary": "2-3 sentence summary"
+}"""
+
+_PORTFOLIO_TOOL_FOOTER = """
+
+Record your analysis with the record_portfolio_analysis tool."""
+
+_STOCK_HEADER = """Analyze this stock and provide an investment recommendation.
+
+Stock: """
+_STOCK_SCHEMA = """
+
+Respond with ONLY valid JSON (no markdown, no extra text):
+{
+    "signal": "buy|hold|sell",
+    "confidence": 0-100,
+    "rationale": "2-3 sentence explanation",
+    "key_factors": ["factor1", "factor2", "factor3"],
+    "risk_level": "low|moderate|high"
+}"""
+
+_STOCKS_HEADER = """Analyze each of these stocks and provide an investment recommendation for every one.
+
+Stocks:
+"""
+_STOCKS_TOOL_FOOTER = """
+
+Record every recommendation with the record_stock_analyses tool."""
+
+_MARKET_SUMMARY_HEADER = """Generate a brief market summary based on the following data.
+
+Major Indices:
+"""
+_MARKET_SUMMARY_MOVERS = """
+
+Top Movers:
+"""
+_MARKET_SUMMARY_FOOTER = """
+
+Write a concise 3-4 sentence summary covering:
+1. Overall market direction
+2. Notable movers or sectors
+3. Key investor sentiment
+
+Keep it brief and informative."""
+
+_PREDICTION_HEADER = "Explain this stock prediction for "
+_PREDICTION_DATA = """:
+
+Prediction Data:
+"""
+_PREDICTION_AUDIENCE = """
+
+Audience: """
+_PREDICTION_FOOTER = """
+
+Provide a 2-3 sentence explanation of why this prediction was made. Focus on key factors."""
+
+_LEVEL_GUIDANCE = {
+    "beginner": "Use simple language. Avoid jargon. Explain any financial terms.",
+    "intermediate": "Some financial knowledge assumed. Brief explanations.",
+    "advanced": "Professional terminology acceptable.",
+}
+
+
+def _portfolio_prompt(
+    holdings: List[Dict[str, Any]],
+    market_context: Dict[str, Any],
+    risk_tolerance: str,
+    footer: str = _PORTFOLIO_SCHEMA,
+) -> str:
+    """Build the portfolio prompt; `footer` states the expected output format."""
+    return "".join([
+        _PORTFOLIO_HEADER, _dumps(holdings),
+        _PORTFOLIO_CONTEXT, _dumps(market_context),
+        _PORTFOLIO_RISK, risk_tolerance,
+        footer,
+    ])
+
+
+def _stock_prompt(
+    symbol: str,
+    quote_data: Dict[str, Any],
+    company_info: Optional[Dict[str, Any]],
+) -> str:
+    """Build the analyze_stock prompt."""
+    return "".join([
+        _STOCK_HEADER, symbol,
+        f"\nCurrent Price: ${quote_data.get('price', 'N/A')}",
+        f"\nChange: {quote_data.get('change_percent', 0):.2f}%",
+        "\n\nCompany Info:\n", _dumps(company_info or {}),
+        _STOCK_SCHEMA,
+    ])
+
+
+def _stock_entry(
+    symbol: str,
+    quote_data: Dict[str, Any],
+    company_info: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Per-symbol input block for the batched stock prompt."""
+    return {
+        "symbol": symbol,
+        "price": quote_data.get("price"),
+        "change_percent": round(quote_data.get("change_percent", 0) or 0, 2),
+        "company": company_info or {},
+    }
+
+
+def _stocks_prompt(entries: List[Dict[str, Any]]) -> str:
+    """Build the analyze_stocks prompt for one batch of symbols."""
+    return "".join([_STOCKS_HEADER, _dumps(entries), _STOCKS_TOOL_FOOTER])
+
+
+def _batch_entries(entries: List[Dict[str, Any]], k: int) -> List[List[Dict[str, Any]]]:
+    """Split entries into batches of at most k symbols and _MAX_BATCH_PROMPT_CHARS of input."""
+    batches: List[List[Dict[str, Any]]] = []
+    batch: List[Dict[str, Any]] = []
+    size = 0
+    for entry in entries:
+        entry_size = len(_dumps(entry))
+        if batch and (len(batch) >= k or size + entry_size > _MAX_BATCH_PROMPT_CHARS):
+            batches.append(batch)
+            batch, size = [], 0
+        batch.append(entry)
+        size += entry_size
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+class _JsonFieldStream:
+    """
+    Incremental scanner for a JSON object arriving in text chunks.
+
+    feed() returns the top-level fields whose values completed in that chunk,
+    so callers can show e.g. "signal" long before the model finishes writing
+    "key_factors". Text before the opening brace is ignored.
+    """
+
+    def __init__(self):
+        self._member: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self.done = False
+
+    def feed(self, text: str) -> Dict[str, Any]:
+        fields: Dict[str, Any] = {}
+        for ch in text:
+            if self.done:
+                break
+            if self._depth == 0:
+                if ch == "{":
+                    self._depth = 1
+                continue
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._emit(fields)
+                    self.done = True
+                    break
+            elif ch == "," and self._depth == 1:
+                self._emit(fields)
+                continue
+            self._member.append(ch)
+        return fields
+
+    def _emit(self, fields: Dict[str, Any]) -> None:
+        member = "".join(self._member).strip()
+        self._member.clear()
+        if not member:
+            return
+        try:
+            fields.update(json.loads("{" + member + "}"))
+        except json.JSONDecodeError:
+            logger.debug("Skipping malformed streamed JSON member: {}", member[:80])
 
 
 class LLMService:
@@ -51,33 +442,205 @@ class LLMService:
     def __init__(self, api_key: Optional[str] = None):
         self._api_key = api_key or settings.anthropic_api_key
         self._client: Optional[anthropic.AsyncAnthropic] = None
+        self._limiter = AsyncRateLimiter(settings.anthropic_rpm, 60)
+        # Responses are shared across workers through Redis when it is up,
+        # with a per-process copy in front (or instead, without Redis)
+        self._redis = async_cache
+        self._response_cache = TTLCache(maxsize=512, ttl=_RESPONSE_CACHE_TTL)
+        # Completions currently in flight, keyed by request digest
+        self._inflight: Dict[str, "asyncio.Task[Optional[Any]]"] = {}
 
     def _get_client(self) -> Optional[anthropic.AsyncAnthropic]:
         if self._client is None and self._api_key:
             try:
-                self._client = anthropic.AsyncAnthropic(api_key=self._api_key)
+                # Retries are handled by _generate, so the SDK's own are disabled
+                self._client = anthropic.AsyncAnthropic(
+                    api_key=self._api_key,
+                    timeout=_REQUEST_TIMEOUT,
+                    max_retries=0,
+                )
                 logger.info("Claude LLM service initialized (model: {})", _MODEL)
             except Exception as exc:
                 logger.error("Failed to init Claude LLM service: {}", exc)
         return self._client
 
+    @retry(
+        stop=stop_after_attempt(_MAX_ATTEMPTS),
+        wait=wait_exponential_jitter(initial=1, max=8),
+        retry=retry_if_exception_type(_RETRYABLE_ERRORS),
+        reraise=True,
+    )
+    async def _generate(
+        self,
+        client: anthropic.AsyncAnthropic,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        tool: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """
+        One bounded messages.create call, retried with jittered backoff on transient errors.
+
+        When `tool` is given, Claude is forced to answer by calling it.
+        """
+        kwargs: Dict[str, Any] = {}
+        if tool is not None:
+            kwargs = {"tools": [tool], "tool_choice": {"type": "tool", "name": tool["name"]}}
+        async with self._limiter:
+            return await asyncio.wait_for(
+                client.messages.create(
+                    model=_MODEL,
+                    max_tokens=min(max_tokens, _MAX_OUTPUT_TOKENS),
+                    temperature=temperature,
+                    messages=[{"role": "user", "content": prompt}],
+                    **kwargs,
+                ),
+                timeout=_REQUEST_TIMEOUT,
+            )
+
+    async def _cache_get(self, key: str) -> Optional[Any]:
+        value = self._response_cache.get(key)
+        if value is not None or self._redis is None:
+            return value
+        try:
+            payload = await self._redis.get(key)
+        except Exception as exc:
+            logger.warning("Redis LLM cache lookup failed: {}", exc)
+            return None
+        if payload is None:
+            return None
+        value = orjson.loads(payload)
+        self._response_cache.set(key, value)
+        return value
+
+    async def _cache_set(self, key: str, value: Any) -> None:
+        self._response_cache.set(key, value)
+        if self._redis is None:
+            return
+        try:
+            await self._redis.set(key, orjson.dumps(value), ex=_RESPONSE_CACHE_TTL)
+        except Exception as exc:
+            logger.warning("Redis LLM cache write failed: {}", exc)
+
+    async def _produce_and_cache(
+        self, key: str, produce: Callable[[], Awaitable[Optional[Any]]]
+    ) -> Optional[Any]:
+        value = await produce()
+        if value is not None:
+            await self._cache_set(key, value)
+        return value
+
+    async def _cached(
+        self, key: str, produce: Callable[[], Awaitable[Optional[Any]]]
+    ) -> Optional[Any]:
+        """
+        Return the cached response for `key`, or run `produce` once to get it.
+
+        Concurrent identical requests share a single call; failures (None)
+        are not cached.
+        """
+        value = await self._cache_get(key)
+        if value is not None:
+            return value
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._produce_and_cache(key, produce))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
     async def _complete(self, prompt: str, max_tokens: int = 1024, temperature: float = 0.3) -> Optional[str]:
         """Send a single user message and return the assistant's text."""
+        return await self._cached(
+            _request_digest(prompt, max_tokens, temperature),
+            lambda: self._complete_uncached(prompt, max_tokens, temperature),
+        )
+
+    async def _complete_uncached(self, prompt: str, max_tokens: int, temperature: float) -> Optional[str]:
         client = self._get_client()
         if client is None:
             return None
         try:
-            msg = await client.messages.create(
-                model=_MODEL,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                messages=[{"role": "user", "content": prompt}],
-            )
+            msg = await self._generate(client, prompt, max_tokens, temperature)
             return msg.content[0].text
         except Exception as exc:
             logger.error("Claude API error: {}", exc)
             return None
 
+    async def _complete_structured(
+        self,
+        prompt: str,
+        tool: Dict[str, Any],
+        max_tokens: int = 1024,
+        temperature: float = 0.3,
+    ) -> Optional[Dict[str, Any]]:
+        """Send a single user message and return the input of the forced `tool` call."""
+        return await self._cached(
+            _request_digest(prompt, max_tokens, temperature, tool),
+            lambda: self._complete_structured_uncached(prompt, tool, max_tokens, temperature),
+        )
+
+    async def _complete_structured_uncached(
+        self, prompt: str, tool: Dict[str, Any], max_tokens: int, temperature: float
+    ) -> Optional[Dict[str, Any]]:
+        client = self._get_client()
+        if client is None:
+            return None
+        while True:
+            try:
+                msg = await self._generate(client, prompt, max_tokens, temperature, tool)
+            except Exception as exc:
+                logger.error("Claude API error: {}", exc)
+                return None
+            if msg.stop_reason != "max_tokens":
+                break
+            # A truncated tool call carries partial input; retry with more room
+            if max_tokens >= _MAX_OUTPUT_TOKENS:
+                logger.error("Claude {} call truncated at {} tokens", tool["name"], max_tokens)
+                return None
+            logger.warning(
+                "Claude {} call truncated at {} tokens; retrying with a larger budget",
+                tool["name"], max_tokens,
+            )
+            max_tokens = min(max_tokens * 2, _MAX_OUTPUT_TOKENS)
+        for block in msg.content:
+            if block.type == "tool_use":
+                return block.input
+        logger.error("Claude response had no {} call", tool["name"])
+        return None
+
+    async def _stream_fields(
+        self, prompt: str, max_tokens: int = 1024, temperature: float = 0.3
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Stream a JSON-object completion, yielding the fields parsed so far.
+
+        Each yielded dict is cumulative and is emitted whenever at least one
+        more top-level field has been completed.
+        """
+        client = self._get_client()
+        if client is None:
+            return
+        parser = _JsonFieldStream()
+        data: Dict[str, Any] = {}
+        try:
+            await self._limiter.acquire()
+            async with client.messages.stream(
+                model=_MODEL,
+                max_tokens=min(max_tokens, _MAX_OUTPUT_TOKENS),
+                temperature=temperature,
+                messages=[{"role": "user", "content": prompt}],
+            ) as stream:
+                async for text in stream.text_stream:
+                    fields = parser.feed(text)
+                    if fields:
+                        data.update(fields)
+                        yield dict(data)
+                    if parser.done:
+                        break
+        except Exception as exc:
+            logger.error("Claude stream error: {}", exc)
+
     async def analyze_portfolio(
         self,
         holdings: List[Dict[str, Any]],
@@ -85,61 +648,20 @@ class LLMService:
         risk_tolerance: str = "moderate",
     ) -> Optional[PortfolioAnalysis]:
         """Generate AI portfolio analysis using Claude."""
-        prompt = f"""Analyze this investment portfolio and provide structured recommendations.
-
-Portfolio Holdings:
-{json.dumps(holdings, indent=2)}
-
-Current Market Context:
-{json.dumps(market_context, indent=2)}
-
-Risk Tolerance: {risk_tolerance}
-
-Respond with ONLY valid JSON in exactly this format (no markdown, no extra text):
-{{
-    "risk_assessment": {{
-        "level": "low|moderate|high",
-        "score": 0-100,
-        "factors": ["factor1", "factor2"]
-    }},
-    "diversification_score": 0-100,
-    "sector_allocation": {{
-        "technology": 0-100,
-        "healthcare": 0-100,
-        "finance": 0-100,
-        "consumer": 0-100,
-        "energy": 0-100,
-        "other": 0-100
-    }},
-    "recommendations": [
-        {{
-            "action": "buy|hold|sell|reduce",
-            "symbol": "TICKER",
-            "confidence": 0-100,
-            "rationale": "explanation"
-        }}
-    ],
-    "overall_rating": "A|B|C|D|F",
-    "summary": "2-3 sentence summary"
-}}"""
+        prompt = _portfolio_prompt(
+            holdings, market_context, risk_tolerance, footer=_PORTFOLIO_TOOL_FOOTER
+        )
 
-        text = await self._complete(prompt, max_tokens=1024)
-        if text is None:
+        data = await self._complete_structured(prompt, _PORTFOLIO_TOOL, max_tokens=1024)
+        if data is None:
             return None
 
         try:
-            data = _parse_json_from_text(text)
-            return PortfolioAnalysis(
-                risk_assessment=data.get("risk_assessment", {}),
-                diversification_score=data.get("diversification_score", 50),
-                sector_allocation=data.get("sector_allocation", {}),
-                recommendations=data.get("recommendations", []),
-                overall_rating=data.get("overall_rating", "C"),
-                summary=data.get("summary", "Analysis completed."),
-            )
-        except json.JSONDecodeError as exc:
-            logger.error("Failed to parse Claude portfolio analysis JSON: {}", exc)
+            result = PortfolioAnalysisModel.model_validate(data)
+        except ValidationError as exc:
+            logger.error("Claude portfolio analysis failed validation: {}", exc)
             return None
+        return PortfolioAnalysis(**result.model_dump())
 
     async def analyze_stock(
         self,
@@ -148,40 +670,114 @@ Respond with ONLY valid JSON in exactly this format (no markdown, no extra text)
         company_info: Optional[Dict[str, Any]] = None,
     ) -> Optional[StockAnalysis]:
         """Generate AI stock analysis using Claude. Falls back to rule-based on error."""
-        prompt = f"""Analyze this stock and provide an investment recommendation.
-
-Stock: {symbol}
-Current Price: ${quote_data.get('price', 'N/A')}
-Change: {quote_data.get('change_percent', 0):.2f}%
+        symbol = symbol.upper()
+        company = {symbol: company_info} if company_info else None
+        analyses = await self.analyze_stocks({symbol: quote_data}, company)
+        return analyses[symbol]
 
-Company Info:
-{json.dumps(company_info or {}, indent=2)}
+    async def analyze_stocks(
+        self,
+        quotes: Dict[str, Dict[str, Any]],
+        company_info: Optional[Dict[str, Dict[str, Any]]] = None,
+        k: int = _STOCK_BATCH_SIZE,
+    ) -> Dict[str, StockAnalysis]:
+        """
+        Analyze several stocks with one Claude request per batch of k symbols.
+
+        Args:
+            quotes: Quote data keyed by symbol
+            company_info: Optional company profile data keyed by symbol
+            k: Maximum symbols per request
+
+        Returns:
+            A StockAnalysis for every requested symbol; symbols the model
+            skipped or that failed fall back to the rule-based analysis
+        """
+        quotes = {sym.upper(): data for sym, data in quotes.items()}
+        company_info = {sym.upper(): data for sym, data in (company_info or {}).items()}
+        entries = [
+            _stock_entry(sym, data, company_info.get(sym)) for sym, data in quotes.items()
+        ]
+
+        results = await asyncio.gather(
+            *(self._analyze_stock_batch(batch) for batch in _batch_entries(entries, k))
+        )
+        analyses: Dict[str, StockAnalysis] = {}
+        for batch_result in results:
+            analyses.update(batch_result)
 
-Respond with ONLY valid JSON (no markdown, no extra text):
-{{
-    "signal": "buy|hold|sell",
-    "confidence": 0-100,
-    "rationale": "2-3 sentence explanation",
-    "key_factors": ["factor1", "factor2", "factor3"],
-    "risk_level": "low|moderate|high"
-}}"""
+        return {
+            sym: analyses.get(sym) or self._rule_based_analysis(sym, data)
+            for sym, data in quotes.items()
+        }
 
-        text = await self._complete(prompt, max_tokens=512)
-        if text is None:
-            return self._rule_based_analysis(symbol, quote_data)
+    async def _analyze_stock_batch(self, entries: List[Dict[str, Any]]) -> Dict[str, StockAnalysis]:
+        """Run one batched prompt and return the analyses it produced, keyed by symbol."""
+        data = await self._complete_structured(
+            _stocks_prompt(entries), _STOCKS_TOOL,
+            max_tokens=max(_STOCK_OUTPUT_TOKENS * len(entries), _MIN_STOCK_BATCH_TOKENS),
+        )
+        if data is None:
+            return {}
 
-        try:
-            data = _parse_json_from_text(text)
-            return StockAnalysis(
-                symbol=symbol,
-                signal=data.get("signal", "hold"),
-                confidence=data.get("confidence", 50),
-                rationale=data.get("rationale", "No analysis available."),
-                key_factors=data.get("key_factors", []),
-                risk_level=data.get("risk_level", "moderate"),
-            )
-        except json.JSONDecodeError:
-            return self._rule_based_analysis(symbol, quote_data)
+        requested = {entry["symbol"] for entry in entries}
+        analyses: Dict[str, StockAnalysis] = {}
+        # Validate per item so one malformed entry doesn't discard the batch
+        for item in data.get("analyses", []):
+            try:
+                result = StockAnalysisModel.model_validate(item)
+            except ValidationError:
+                continue
+            symbol = result.symbol.upper()
+            if symbol in requested:
+                analyses[symbol] = StockAnalysis(**(result.model_dump() | {"symbol": symbol}))
+        return analyses
+
+    async def stream_portfolio_analysis(
+        self,
+        holdings: List[Dict[str, Any]],
+        market_context: Dict[str, Any],
+        risk_tolerance: str = "moderate",
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Streaming variant of analyze_portfolio.
+
+        Yields the PortfolioAnalysis fields completed so far (cumulative) as
+        Claude writes them, so "summary" or "overall_rating" can be shown
+        before the whole analysis has been generated.
+        """
+        prompt = _portfolio_prompt(holdings, market_context, risk_tolerance)
+        async for data in self._stream_fields(prompt, max_tokens=1024):
+            yield data
+
+    async def stream_stock_analysis(
+        self,
+        symbol: str,
+        quote_data: Dict[str, Any],
+        company_info: Optional[Dict[str, Any]] = None,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Streaming variant of analyze_stock.
+
+        Yields the StockAnalysis fields completed so far (cumulative). Falls
+        back to a single rule-based result when Claude is unavailable or
+        returns nothing parseable.
+        """
+        prompt = _stock_prompt(symbol, quote_data, company_info)
+        streamed = False
+        async for data in self._stream_fields(prompt, max_tokens=512):
+            streamed = True
+            yield {"symbol": symbol, **data}
+        if not streamed:
+            fallback = self._rule_based_analysis(symbol, quote_data)
+            yield {
+                "symbol": fallback.symbol,
+                "signal": fallback.signal,
+                "confidence": fallback.confidence,
+                "rationale": fallback.rationale,
+                "key_factors": fallback.key_factors,
+                "risk_level": fallback.risk_level,
+            }
 
     def _rule_based_analysis(self, symbol: str, quote_data: Dict[str, Any]) -> StockAnalysis:
         """Rule-based fallback when Claude is unavailable."""
@@ -222,20 +818,11 @@ Respond with ONLY valid JSON (no markdown, no extra text):
         top_movers: List[Dict[str, Any]],
     ) -> Optional[str]:
         """Generate a brief market summary using Claude."""
-        prompt = f"""Generate a brief market summary based on the following data.
-
-Major Indices:
-{json.dumps(indices_data, indent=2)}
-
-Top Movers:
-{json.dumps(top_movers, indent=2)}
-
-Write a concise 3-4 sentence summary covering:
-1. Overall market direction
-2. Notable movers or sectors
-3. Key investor sentiment
-
-Keep it brief and informative."""
+        prompt = "".join([
+            _MARKET_SUMMARY_HEADER, _dumps(indices_data),
+            _MARKET_SUMMARY_MOVERS, _dumps(top_movers),
+            _MARKET_SUMMARY_FOOTER,
+        ])
 
         return await self._complete(prompt, max_tokens=256, temperature=0.4)
 
@@ -246,21 +833,13 @@ Keep it brief and informative."""
         user_level: str = "beginner",
     ) -> Optional[str]:
         """Explain a prediction in user-friendly terms using Claude."""
-        level_guidance = {
-            "beginner": "Use simple language. Avoid jargon. Explain any financial terms.",
-            "intermediate": "Some financial knowledge assumed. Brief explanations.",
-            "advanced": "Professional terminology acceptable.",
-        }
-
-        prompt = f"""Explain this stock prediction for {symbol}:
-
-Prediction Data:
-{json.dumps(prediction_data, indent=2)}
-
-Audience: {user_level} investor
-{level_guidance.get(user_level, level_guidance['beginner'])}
-
-Provide a 2-3 sentence explanation of why this prediction was made. Focus on key factors."""
+        prompt = "".join([
+            _PREDICTION_HEADER, symbol,
+            _PREDICTION_DATA, _dumps(prediction_data),
+            _PREDICTION_AUDIENCE, user_level, " investor\n",
+            _LEVEL_GUIDANCE.get(user_level, _LEVEL_GUIDANCE["beginner"]),
+            _PREDICTION_FOOTER,
+        ])
 
         return await self._complete(prompt, max_tokens=256)
 
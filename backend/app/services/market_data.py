@@ -1,21 +1,84 @@
 """Market data service for fetching real-time and historical stock data."""
 
 import asyncio
+import hashlib
+import os
+import time
+import uuid
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from pathlib import Path
 
 import httpx
+import numpy as np
+import orjson
 import pandas as pd
 import yfinance as yf
 from loguru import logger
 
+from app.core.cache import TTLCache, async_cache
 from app.core.config import get_settings
+from app.core.rate_limit import AsyncRateLimiter
 
-settings = get_settings()
+try:
+    import h2  # noqa: F401  (enables httpx HTTP/2 support)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+    logger.warning("h2 not installed — Finnhub client will use HTTP/1.1")
 
+settings = get_settings()
 
-@dataclass
+# One keep-alive pool per client; parallel quote fan-outs reuse these
+# connections (multiplexed as HTTP/2 streams when h2 is available).
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+_HTTP_TIMEOUT = httpx.Timeout(connect=5.0, read=15.0, write=5.0, pool=5.0)
+# Finnhub has no multi-symbol quote endpoint, so batch quotes fan out one
+# request per symbol; at most this many are on the wire at once.
+_MAX_CONCURRENT_REQUESTS = 8
+
+# Quotes are shared across workers through Redis (L2) for _QUOTE_TTL seconds;
+# each process keeps a short-lived L1 copy so hot symbols skip the round trip.
+_QUOTE_TTL = 60
+_QUOTE_L1_TTL = 5
+# How long one worker may hold a symbol's fetch lock, and how often the
+# others poll Redis for its result while waiting
+_QUOTE_LOCK_TTL = 10
+_QUOTE_LOCK_POLL = 0.1
+# Delete the lock only if it still holds our token, so a fetch that outlived
+# _QUOTE_LOCK_TTL cannot release the lock another worker has since taken
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# Closed historical candle windows are kept on disk for a day, up to 1 GiB
+_CANDLE_CACHE_TTL = 86400
+_CANDLE_CACHE_SIZE_LIMIT = 2 ** 30
+_SECONDS_PER_DAY = 86400
+
+# Market overview is recomputed in the background this often
+_INDEX_REFRESH_SECONDS = 60
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """HTTP client configured for Finnhub; the app creates one in its lifespan and shares it."""
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        limits=_HTTP_LIMITS,
+        timeout=_HTTP_TIMEOUT,
+    )
+
+
+def _json(response: httpx.Response) -> Any:
+    """Decode a JSON body with orjson straight from the raw bytes."""
+    return orjson.loads(response.content)
+
+
+@dataclass(frozen=True, slots=True)
 class StockQuote:
     """Real-time stock quote data."""
 
@@ -34,7 +97,7 @@ class StockQuote:
         return self.change >= 0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CompanyProfile:
     """Company profile information."""
 
@@ -48,7 +111,7 @@ class CompanyProfile:
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MarketNews:
     """Market news item."""
 
@@ -60,36 +123,185 @@ class MarketNews:
     image: Optional[str] = None
 
 
+class _CandleDiskCache:
+    """
+    Compressed .npz files of candle columns, one per key.
+
+    Entries expire `ttl` seconds after being written; once the directory
+    grows past `size_limit` bytes the oldest files are removed first.
+    """
+
+    def __init__(self, directory: str, ttl: float, size_limit: int):
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self.size_limit = size_limit
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return self.directory / f"{digest}.npz"
+
+    def get(self, key: str) -> Optional[Dict[str, np.ndarray]]:
+        """Return the cached columns for `key`, or None if missing or expired."""
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                path.unlink(missing_ok=True)
+                return None
+            with np.load(path) as data:
+                return {name: data[name] for name in data.files}
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Unreadable candle cache entry {path.name}: {e}")
+            return None
+
+    def set(self, key: str, columns: Dict[str, np.ndarray]) -> None:
+        """Write `columns` for `key` atomically, then enforce the size limit."""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self._path(key)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "wb") as f:
+                np.savez_compressed(f, **columns)
+            os.replace(tmp, path)
+            self._prune()
+        except Exception as e:
+            logger.warning(f"Failed to write candle cache entry: {e}")
+
+    def _prune(self) -> None:
+        entries = []
+        for path in self.directory.glob("*.npz"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.size_limit:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+def _candle_columns(data: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    """
+    Typed column arrays for a Finnhub candle payload.
+
+    Prices fit float32; volumes stay float64 because share counts exceed
+    float32's exact range. Timestamps stay as int64 epoch seconds.
+    """
+    return {
+        "timestamp": np.asarray(data["t"], dtype=np.int64),
+        "open": np.asarray(data["o"], dtype=np.float32),
+        "high": np.asarray(data["h"], dtype=np.float32),
+        "low": np.asarray(data["l"], dtype=np.float32),
+        "close": np.asarray(data["c"], dtype=np.float32),
+        "volume": np.asarray(data["v"], dtype=np.float64),
+    }
+
+
+def _slice_columns(columns: Dict[str, np.ndarray], start: int, end: int) -> Dict[str, np.ndarray]:
+    """Rows of `columns` whose timestamp falls within [start, end]."""
+    ts = columns["timestamp"]
+    mask = (ts >= start) & (ts <= end)
+    return {name: values[mask] for name, values in columns.items()}
+
+
+def _candle_frame(columns: Dict[str, np.ndarray]) -> pd.DataFrame:
+    """DataFrame adopting the arrays from _candle_columns without copying them."""
+    frame = dict(columns)
+    frame["timestamp"] = pd.to_datetime(columns["timestamp"], unit="s", utc=True, cache=True)
+    return pd.DataFrame(frame, copy=False)
+
+
 class FinnhubClient:
-    """Client for Finnhub API."""
+    """
+    Client for Finnhub API.
+
+    Args:
+        api_key: Finnhub token; defaults to FINNHUB_API_KEY
+        client: Shared HTTP client owned by the caller. When omitted the
+            instance creates its own on first request and closes it in close().
+    """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
         self.api_key = api_key or settings.finnhub_api_key
         self.base_url = "https://finnhub.io/api/v1"
-        self._client: Optional[httpx.AsyncClient] = None
-
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(timeout=30.0)
+        # Endpoint URLs and the auth query parameter are fixed per client
+        self._url_quote = f"{self.base_url}/quote"
+        self._url_profile = f"{self.base_url}/stock/profile2"
+        self._url_candle = f"{self.base_url}/stock/candle"
+        self._url_company_news = f"{self.base_url}/company-news"
+        self._url_news = f"{self.base_url}/news"
+        self._url_search = f"{self.base_url}/search"
+        self._auth_params = {"token": self.api_key}
+        self._owns_client = client is None
+        self._client: Optional[httpx.AsyncClient] = client
+        self._limiter = AsyncRateLimiter(settings.finnhub_rpm, 60)
+        self._semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+        self._candle_cache = _CandleDiskCache(
+            settings.candle_cache_path, _CANDLE_CACHE_TTL, _CANDLE_CACHE_SIZE_LIMIT
+        )
+
+    def _http(self) -> httpx.AsyncClient:
+        # Only standalone instances get here without a client; nothing is
+        # opened at import time
+        if self._client is None:
+            self._client = create_http_client()
         return self._client
 
     async def close(self):
-        """Close HTTP client."""
-        if self._client and not self._client.is_closed:
+        """Close the HTTP client if this instance created it; a shared one belongs to its owner."""
+        if self._owns_client and self._client is not None and not self._client.is_closed:
             await self._client.aclose()
             self._client = None
 
+    async def use_http_client(self, client: httpx.AsyncClient) -> None:
+        """
+        Send requests through `client` from now on.
+
+        The rate limiter and concurrency slots stay with this instance, so
+        switching clients doesn't reset the request budget.
+
+        Args:
+            client: Shared HTTP client, closed by its owner rather than here
+        """
+        await self.close()
+        self._client = client
+        self._owns_client = False
+
+    async def __aenter__(self) -> "FinnhubClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def _request(self, url: str, params: Dict[str, Any]) -> httpx.Response:
+        """GET `url` once a concurrency and rate-limit slot is free; raises on HTTP errors."""
+        async with self._semaphore, self._limiter:
+            response = await self._http().get(url, params=params)
+        remaining = response.headers.get("x-ratelimit-remaining")
+        if remaining is not None and remaining.isdigit():
+            self._limiter.sync_remaining(int(remaining))
+        response.raise_for_status()
+        return response
+
     async def get_quote(self, symbol: str) -> Optional[StockQuote]:
         """Get real-time quote for a symbol."""
+        return await self._fetch_quote(symbol.upper())
+
+    async def _fetch_quote(self, symbol: str) -> Optional[StockQuote]:
+        """get_quote for an already upper-cased symbol."""
         try:
-            client = await self._get_client()
-            url = f"{self.base_url}/quote"
-            params = {"symbol": symbol.upper(), "token": self.api_key}
+            params = self._auth_params | {"symbol": symbol}
 
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            response = await self._request(self._url_quote, params)
+            data = _json(response)
 
             # Check for API error
             if data.get("error"):
@@ -97,7 +309,7 @@ class FinnhubClient:
                 return None
 
             return StockQuote(
-                symbol=symbol.upper(),
+                symbol=symbol,
                 price=data.get("c", 0.0),
                 change=data.get("d", 0.0),
                 change_percent=data.get("dp", 0.0),
@@ -113,13 +325,14 @@ class FinnhubClient:
 
     async def get_batch_quotes(self, symbols: List[str]) -> Dict[str, StockQuote]:
         """Get quotes for multiple symbols."""
-        tasks = [self.get_quote(symbol) for symbol in symbols]
+        symbols = [symbol.upper() for symbol in symbols]
+        tasks = [self._fetch_quote(symbol) for symbol in symbols]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         quotes = {}
         for symbol, result in zip(symbols, results):
             if isinstance(result, StockQuote):
-                quotes[symbol.upper()] = result
+                quotes[symbol] = result
             elif isinstance(result, Exception):
                 logger.error(f"Error fetching {symbol}: {result}")
 
@@ -127,20 +340,18 @@ class FinnhubClient:
 
     async def get_company_profile(self, symbol: str) -> Optional[CompanyProfile]:
         """Get company profile."""
+        symbol = symbol.upper()
         try:
-            client = await self._get_client()
-            url = f"{self.base_url}/stock/profile2"
-            params = {"symbol": symbol.upper(), "token": self.api_key}
+            params = self._auth_params | {"symbol": symbol}
 
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            response = await self._request(self._url_profile, params)
+            data = _json(response)
 
             if not data or data.get("error"):
                 return None
 
             return CompanyProfile(
-                symbol=symbol.upper(),
+                symbol=symbol,
                 name=data.get("name", ""),
                 industry=data.get("finnhubIndustry", ""),
                 sector=data.get("sector", ""),
@@ -161,6 +372,7 @@ class FinnhubClient:
         to_timestamp: Optional[int] = None,
     ) -> Optional[pd.DataFrame]:
         """Get historical candlestick data."""
+        symbol = symbol.upper()
         try:
             # Default to last year if not specified
             if to_timestamp is None:
@@ -168,36 +380,38 @@ class FinnhubClient:
             if from_timestamp is None:
                 from_timestamp = int((datetime.now() - timedelta(days=365)).timestamp())
 
-            client = await self._get_client()
-            url = f"{self.base_url}/stock/candle"
-            params = {
-                "symbol": symbol.upper(),
+            # Windows that closed before today's UTC midnight no longer change:
+            # fetch and cache them as whole days, then slice out the requested range
+            cache_key = None
+            fetch_from, fetch_to = from_timestamp, to_timestamp
+            today = int(time.time()) // _SECONDS_PER_DAY * _SECONDS_PER_DAY
+            if to_timestamp < today:
+                fetch_from -= fetch_from % _SECONDS_PER_DAY
+                fetch_to = -(-fetch_to // _SECONDS_PER_DAY) * _SECONDS_PER_DAY
+                cache_key = f"{symbol}:{resolution}:{fetch_from}:{fetch_to}"
+                columns = await asyncio.to_thread(self._candle_cache.get, cache_key)
+                if columns is not None:
+                    return _candle_frame(_slice_columns(columns, from_timestamp, to_timestamp))
+
+            params = self._auth_params | {
+                "symbol": symbol,
                 "resolution": resolution,
-                "from": from_timestamp,
-                "to": to_timestamp,
-                "token": self.api_key,
+                "from": fetch_from,
+                "to": fetch_to,
             }
 
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            response = await self._request(self._url_candle, params)
+            data = _json(response)
 
             if data.get("s") != "ok":
                 logger.error(f"Error fetching candles for {symbol}: {data}")
                 return None
 
-            df = pd.DataFrame(
-                {
-                    "timestamp": pd.to_datetime(data["t"], unit="s"),
-                    "open": data["o"],
-                    "high": data["h"],
-                    "low": data["l"],
-                    "close": data["c"],
-                    "volume": data["v"],
-                }
-            )
-
-            return df
+            columns = _candle_columns(data)
+            if cache_key is not None:
+                await asyncio.to_thread(self._candle_cache.set, cache_key, columns)
+                columns = _slice_columns(columns, from_timestamp, to_timestamp)
+            return _candle_frame(columns)
         except Exception as e:
             logger.error(f"Error fetching candles for {symbol}: {e}")
             return None
@@ -210,28 +424,24 @@ class FinnhubClient:
     ) -> List[MarketNews]:
         """Get market news."""
         try:
-            client = await self._get_client()
-
             if symbol:
-                url = f"{self.base_url}/company-news"
+                url = self._url_company_news
                 # Get news from last 7 days
                 to_date = datetime.now()
                 from_date = to_date - timedelta(days=7)
-                params = {
+                params = self._auth_params | {
                     "symbol": symbol.upper(),
                     "from": from_date.strftime("%Y-%m-%d"),
                     "to": to_date.strftime("%Y-%m-%d"),
-                    "token": self.api_key,
                 }
             else:
-                url = f"{self.base_url}/news"
-                params = {"category": category, "token": self.api_key}
+                url = self._url_news
+                params = self._auth_params | {"category": category}
                 if min_id:
                     params["minId"] = min_id
 
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            response = await self._request(url, params)
+            data = _json(response)
 
             news_items = []
             for item in data[:20]:  # Limit to 20 items
@@ -251,6 +461,12 @@ class FinnhubClient:
             logger.error(f"Error fetching news: {e}")
             return []
 
+    async def search_symbols(self, query: str) -> List[Dict[str, Any]]:
+        """Search symbols; returns Finnhub's raw result items."""
+        params = self._auth_params | {"q": query}
+        response = await self._request(self._url_search, params)
+        return _json(response).get("result", [])
+
     async def get_market_indices(self) -> Dict[str, Dict[str, Any]]:
         """
         Fetch major market indices via Finnhub using liquid ETF proxies.
@@ -287,43 +503,139 @@ class FinnhubClient:
 
 
 class MarketDataService:
-    """High-level market data service with caching."""
+    """
+    High-level market data service with caching.
+
+    Args:
+        client: Shared HTTP client for Finnhub requests; see use_http_client
+    """
+
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        self.finnhub = FinnhubClient(client=client)
+        self._redis = async_cache
+        l1_ttl = _QUOTE_L1_TTL if self._redis is not None else _QUOTE_TTL
+        self._quote_cache = TTLCache(maxsize=4096, ttl=l1_ttl)
+        # Last successfully computed market overview, kept fresh by the
+        # background refresh task and served as-is while Finnhub is failing
+        self._overview: Optional[Dict[str, Any]] = None
+        self._refresh_task: "Optional[asyncio.Task[None]]" = None
+        # Finnhub quote requests currently in flight, keyed by symbol
+        self._inflight: Dict[str, "asyncio.Task[Optional[StockQuote]]"] = {}
+
+    @staticmethod
+    def _quote_key(symbol: str) -> str:
+        return f"quote:{symbol}"
+
+    async def _get_shared_quotes(self, symbols: List[str]) -> Dict[str, StockQuote]:
+        """Read quotes other workers have cached in Redis, filling the local cache."""
+        if self._redis is None or not symbols:
+            return {}
+        try:
+            raw = await self._redis.mget([self._quote_key(s) for s in symbols])
+        except Exception as e:
+            logger.warning(f"Redis quote lookup failed: {e}")
+            return {}
+
+        quotes = {}
+        for symbol, payload in zip(symbols, raw):
+            if payload is not None:
+                quote = StockQuote(**orjson.loads(payload))
+                self._quote_cache.set(symbol, quote)
+                quotes[symbol] = quote
+        return quotes
 
-    def __init__(self):
-        self.finnhub = FinnhubClient()
-        self._cache: Dict[str, Any] = {}
-        self._cache_ttl: Dict[str, datetime] = {}
+    async def _set_shared_quote(self, quote: StockQuote) -> None:
+        if self._redis is None:
+            return
+        try:
+            await self._redis.set(
+                self._quote_key(quote.symbol), orjson.dumps(asdict(quote)), ex=_QUOTE_TTL
+            )
+        except Exception as e:
+            logger.warning(f"Redis quote write failed: {e}")
 
-    def _get_cache_key(self, prefix: str, identifier: str) -> str:
-        """Generate cache key."""
-        return f"{prefix}:{identifier}"
+    async def _acquire_fetch_lock(self, symbol: str) -> Optional[str]:
+        """
+        Try to become the one worker fetching `symbol` from Finnhub.
 
-    def _is_cache_valid(self, key: str, ttl_seconds: int = 60) -> bool:
-        """Check if cache entry is still valid."""
-        if key not in self._cache_ttl:
-            return False
-        expiry = self._cache_ttl[key]
-        return datetime.now() < expiry
+        Returns the lock token when this process holds the lock, an empty
+        string when Redis is unavailable and it should just fetch, or None
+        when another worker is already fetching.
+        """
+        if self._redis is None:
+            return ""
+        token = uuid.uuid4().hex
+        try:
+            acquired = await self._redis.set(
+                f"{self._quote_key(symbol)}:lock", token, nx=True, ex=_QUOTE_LOCK_TTL
+            )
+        except Exception as e:
+            logger.warning(f"Redis quote lock failed: {e}")
+            return ""
+        return token if acquired else None
+
+    async def _release_fetch_lock(self, symbol: str, token: str) -> None:
+        if self._redis is None or not token:
+            return
+        try:
+            await self._redis.eval(
+                _RELEASE_LOCK_SCRIPT, 1, f"{self._quote_key(symbol)}:lock", token
+            )
+        except Exception as e:
+            logger.warning(f"Redis quote unlock failed: {e}")
+
+    async def _fetch_and_cache_quote(self, symbol: str) -> Optional[StockQuote]:
+        token = await self._acquire_fetch_lock(symbol)
+        if token is None:
+            # Another worker is fetching this symbol; wait for it to publish
+            deadline = time.monotonic() + _QUOTE_LOCK_TTL
+            while time.monotonic() < deadline:
+                await asyncio.sleep(_QUOTE_LOCK_POLL)
+                shared = await self._get_shared_quotes([symbol])
+                if symbol in shared:
+                    return shared[symbol]
+            logger.warning(f"Timed out waiting for shared quote for {symbol}; fetching directly")
 
-    def _set_cache(self, key: str, value: Any, ttl_seconds: int = 60):
-        """Set cache entry with TTL."""
-        self._cache[key] = value
-        self._cache_ttl[key] = datetime.now() + timedelta(seconds=ttl_seconds)
+        try:
+            quote = await self.finnhub.get_quote(symbol)
+            if quote:
+                self._quote_cache.set(symbol, quote)
+                await self._set_shared_quote(quote)
+            return quote
+        finally:
+            if token:
+                await self._release_fetch_lock(symbol, token)
+
+    def _quote_task(self, symbol: str) -> "asyncio.Task[Optional[StockQuote]]":
+        """
+        Return the in-flight Finnhub fetch for `symbol`, starting one if needed.
+
+        Concurrent cache misses for the same symbol share a single upstream
+        request. Callers await it through asyncio.shield so one cancelled
+        request does not cancel the fetch for the others.
+        """
+        task = self._inflight.get(symbol)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_cache_quote(symbol))
+            self._inflight[symbol] = task
+            task.add_done_callback(lambda _: self._inflight.pop(symbol, None))
+        return task
 
     async def get_quote(
         self, symbol: str, use_cache: bool = True
     ) -> Optional[StockQuote]:
         """Get quote with caching."""
-        cache_key = self._get_cache_key("quote", symbol.upper())
-
-        if use_cache and self._is_cache_valid(cache_key, 60):
-            return self._cache.get(cache_key)
+        symbol = symbol.upper()
 
-        quote = await self.finnhub.get_quote(symbol)
-        if quote:
-            self._set_cache(cache_key, quote, 60)
+        if use_cache:
+            quote = self._quote_cache.get(symbol)
+            if quote is not None:
+                return quote
+            shared = await self._get_shared_quotes([symbol])
+            if symbol in shared:
+                return shared[symbol]
 
-        return quote
+        return await asyncio.shield(self._quote_task(symbol))
 
     async def get_batch_quotes(self, symbols: List[str]) -> Dict[str, StockQuote]:
         """Get multiple quotes with individual caching."""
@@ -332,19 +644,30 @@ class MarketDataService:
 
         # Check cache first
         for symbol in symbols:
-            cache_key = self._get_cache_key("quote", symbol.upper())
-            if self._is_cache_valid(cache_key, 60):
-                result[symbol.upper()] = self._cache[cache_key]
+            symbol = symbol.upper()
+            quote = self._quote_cache.get(symbol)
+            if quote is not None:
+                result[symbol] = quote
             else:
                 symbols_to_fetch.append(symbol)
 
-        # Fetch missing quotes
+        # Then the cache shared with other workers
         if symbols_to_fetch:
-            quotes = await self.finnhub.get_batch_quotes(symbols_to_fetch)
-            for symbol, quote in quotes.items():
-                cache_key = self._get_cache_key("quote", symbol)
-                self._set_cache(cache_key, quote, 60)
-                result[symbol] = quote
+            shared = await self._get_shared_quotes(symbols_to_fetch)
+            result.update(shared)
+            symbols_to_fetch = [s for s in symbols_to_fetch if s not in shared]
+
+        # Fetch missing quotes, joining any fetch already in flight
+        if symbols_to_fetch:
+            quotes = await asyncio.gather(
+                *(asyncio.shield(self._quote_task(symbol)) for symbol in symbols_to_fetch),
+                return_exceptions=True,
+            )
+            for symbol, quote in zip(symbols_to_fetch, quotes):
+                if isinstance(quote, StockQuote):
+                    result[symbol] = quote
+                elif isinstance(quote, Exception):
+                    logger.error(f"Error fetching {symbol}: {quote}")
 
         return result
 
@@ -369,37 +692,63 @@ class MarketDataService:
         ]
         return await self.get_batch_quotes(popular_symbols)
 
-    async def get_market_overview(self) -> Dict[str, Any]:
-        """Get market overview with indices and sentiment."""
-        cache_key = "market:overview"
-
-        if self._is_cache_valid(cache_key, 300):  # 5 minute cache
-            return self._cache.get(cache_key)
+    async def use_http_client(self, client: httpx.AsyncClient) -> None:
+        """Route Finnhub requests through `client`, closing the client it replaces."""
+        await self.finnhub.use_http_client(client)
 
+    async def _compute_overview(self) -> Dict[str, Any]:
         indices = await self.finnhub.get_market_indices()
-
-        overview = {
+        return {
             "indices": indices,
             "timestamp": datetime.now().isoformat(),
             "market_status": "open",  # Could be enhanced with actual market hours
         }
 
-        self._set_cache(cache_key, overview, 300)
-        return overview
+    async def _refresh_overview(self) -> None:
+        overview = await self._compute_overview()
+        # Keep the last good indices if this round came back empty
+        if overview["indices"] or self._overview is None:
+            self._overview = overview
+
+    async def _refresh_indices_loop(self) -> None:
+        while True:
+            try:
+                await self._refresh_overview()
+            except Exception as e:
+                logger.error(f"Error refreshing market overview: {e}")
+            await asyncio.sleep(_INDEX_REFRESH_SECONDS)
+
+    def start_index_refresh(self) -> None:
+        """Start refreshing the market overview in the background."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_indices_loop())
+
+    async def stop_index_refresh(self) -> None:
+        """Cancel the background refresh started by start_index_refresh."""
+        if self._refresh_task is None:
+            return
+        self._refresh_task.cancel()
+        try:
+            await self._refresh_task
+        except asyncio.CancelledError:
+            pass
+        self._refresh_task = None
+
+    async def get_market_overview(self) -> Dict[str, Any]:
+        """Get market overview with indices and sentiment."""
+        # Normally served from the background refresh; compute inline only
+        # before the first refresh has completed
+        if self._overview is None:
+            await self._refresh_overview()
+        return self._overview
 
     async def search_symbols(self, query: str) -> List[Dict[str, str]]:
         """Search for stock symbols."""
         try:
-            client = await self.finnhub._get_client()
-            url = f"{self.finnhub.base_url}/search"
-            params = {"q": query, "token": self.finnhub.api_key}
-
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            items = await self.finnhub.search_symbols(query)
 
             results = []
-            for item in data.get("result", [])[:10]:
+            for item in items[:10]:
                 results.append(
                     {
                         "symbol": item.get("symbol"),
@@ -418,6 +767,5 @@ class MarketDataService:
         await self.finnhub.close()
 
 
-# Global instances
-finnhub_client = FinnhubClient()
+# Global instance; the app lifespan injects its shared HTTP client
 market_data_service = MarketDataService()
@@ -19,6 +19,7 @@ import httpx
 from loguru import logger
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.core.config import get_settings
 
@@ -60,7 +61,11 @@ async def update_portfolio_prices(db: AsyncSession, portfolio_id: int) -> Option
     """
     from app.models.portfolio import Portfolio, PortfolioSnapshot
 
-    result = await db.execute(select(Portfolio).where(Portfolio.id == portfolio_id))
+    result = await db.execute(
+        select(Portfolio)
+        .options(selectinload(Portfolio.holdings))
+        .where(Portfolio.id == portfolio_id)
+    )
     portfolio = result.scalar_one_or_none()
     if not portfolio:
         return None
@@ -0,0 +1,324 @@
+//! Native backend for `StreamingFactorEngine`.
+//!
+//! Mirrors `app/engines/quant_engine/streaming.py` one to one: every factor
+//! keeps its rolling state here and advances by one bar per `update`, so the
+//! values match the last row of `factors_kernels.compute_all_factors`.
+//! Window lengths must stay in sync with the constants in `factors_kernels`.
+
+use std::collections::VecDeque;
+
+use pyo3::prelude::*;
+
+const MOMENTUM_1M: usize = 20;
+const MOMENTUM_3M: usize = 60;
+const MOMENTUM_12M: usize = 240;
+const MOMENTUM_12M_OFFSET: usize = 20;
+const RSI_PERIOD: usize = 14;
+const VOL_SHORT: usize = 20;
+const VOL_LONG: usize = 60;
+const DRAWDOWN_PERIOD: usize = 20;
+const SMA_PERIOD: usize = 20;
+const ATR_PERIOD: usize = 14;
+const VOLUME_PERIOD: usize = 20;
+/// Ticks between full recomputes of the Bollinger window sums.
+const RESYNC_INTERVAL: usize = 10_000;
+
+/// Number of values returned by `update`, in `FACTOR_COLUMNS` order.
+const N_FACTORS: usize = 12;
+
+/// Fixed-length ring buffer with running sum and sum of squares.
+struct Window {
+    ring: Vec<f64>,
+    pos: usize,
+    total: f64,
+    total_sq: f64,
+    count: usize,
+}
+
+impl Window {
+    fn new(size: usize) -> Self {
+        Window {
+            ring: vec![f64::NAN; size],
+            pos: 0,
+            total: 0.0,
+            total_sq: 0.0,
+            count: 0,
+        }
+    }
+
+    fn push(&mut self, value: f64) {
+        // Add before removing, in the same order as factors_kernels._slide,
+        // so the running sums round identically to the batch kernels
+        let old = self.ring[self.pos];
+        if !value.is_nan() {
+            self.total += value;
+            self.total_sq += value * value;
+            self.count += 1;
+        }
+        if !old.is_nan() {
+            self.total -= old;
+            self.total_sq -= old * old;
+            self.count -= 1;
+        }
+        self.ring[self.pos] = value;
+        self.pos = (self.pos + 1) % self.ring.len();
+    }
+
+    /// Rebuild the running sums from the ring, oldest value first.
+    fn resync(&mut self) {
+        let size = self.ring.len();
+        self.total = 0.0;
+        self.total_sq = 0.0;
+        self.count = 0;
+        for k in 0..size {
+            let value = self.ring[(self.pos + k) % size];
+            if !value.is_nan() {
+                self.total += value;
+                self.total_sq += value * value;
+                self.count += 1;
+            }
+        }
+    }
+
+    fn mean(&self) -> f64 {
+        let size = self.ring.len();
+        if self.count == size {
+            self.total / size as f64
+        } else {
+            f64::NAN
+        }
+    }
+
+    fn std(&self) -> f64 {
+        let size = self.ring.len();
+        if self.count != size || size < 2 {
+            return f64::NAN;
+        }
+        let n = size as f64;
+        let var = (self.total_sq - self.total * self.total / n) / (n - 1.0);
+        if var > 0.0 {
+            var.sqrt()
+        } else {
+            0.0
+        }
+    }
+}
+
+/// Exponential moving average with pandas' adjust=True weighting.
+struct Ema {
+    decay: f64,
+    value: f64,
+    old_wt: f64,
+}
+
+impl Ema {
+    fn new(span: usize) -> Self {
+        Ema {
+            decay: 1.0 - 2.0 / (span as f64 + 1.0),
+            value: f64::NAN,
+            old_wt: 1.0,
+        }
+    }
+
+    fn push(&mut self, x: f64) -> f64 {
+        if !self.value.is_nan() {
+            self.old_wt *= self.decay;
+            if !x.is_nan() {
+                self.value = (self.old_wt * self.value + x) / (self.old_wt + 1.0);
+                self.old_wt += 1.0;
+            }
+        } else if !x.is_nan() {
+            self.value = x;
+        }
+        self.value
+    }
+}
+
+/// Rolling max (sign = 1) or min (sign = -1) over `period` ticks, skipping NaNs.
+struct MonotonicWindow {
+    period: usize,
+    sign: f64,
+    items: VecDeque<(usize, f64)>,
+}
+
+impl MonotonicWindow {
+    fn new(period: usize, sign: f64) -> Self {
+        MonotonicWindow {
+            period,
+            sign,
+            items: VecDeque::with_capacity(period),
+        }
+    }
+
+    fn push(&mut self, tick: usize, value: f64) -> f64 {
+        while let Some(&(front, _)) = self.items.front() {
+            if front + self.period <= tick {
+                self.items.pop_front();
+            } else {
+                break;
+            }
+        }
+        if !value.is_nan() {
+            while let Some(&(_, back)) = self.items.back() {
+                if self.sign * value >= self.sign * back {
+                    self.items.pop_back();
+                } else {
+                    break;
+                }
+            }
+            self.items.push_back((tick, value));
+        }
+        self.items.front().map_or(f64::NAN, |&(_, v)| v)
+    }
+}
+
+/// O(1)-per-tick technical factors for one symbol.
+#[pyclass]
+struct StreamingFactorEngineRs {
+    tick: Option<usize>,
+    closes: Vec<f64>,
+    prev_close: f64,
+    gains: Window,
+    losses: Window,
+    ema_fast: Ema,
+    ema_slow: Ema,
+    returns_short: Window,
+    returns_long: Window,
+    peak: MonotonicWindow,
+    trough: MonotonicWindow,
+    close_window: Window,
+    true_range: Window,
+    volume_window: Window,
+}
+
+impl StreamingFactorEngineRs {
+    fn lagged_close(&self, tick: usize, lag: usize) -> f64 {
+        if tick < lag {
+            f64::NAN
+        } else {
+            self.closes[(tick - lag) % self.closes.len()]
+        }
+    }
+}
+
+#[pymethods]
+impl StreamingFactorEngineRs {
+    #[new]
+    fn new() -> Self {
+        StreamingFactorEngineRs {
+            tick: None,
+            closes: vec![f64::NAN; MOMENTUM_12M + MOMENTUM_12M_OFFSET + 1],
+            prev_close: f64::NAN,
+            gains: Window::new(RSI_PERIOD),
+            losses: Window::new(RSI_PERIOD),
+            ema_fast: Ema::new(12),
+            ema_slow: Ema::new(26),
+            returns_short: Window::new(VOL_SHORT),
+            returns_long: Window::new(VOL_LONG),
+            peak: MonotonicWindow::new(DRAWDOWN_PERIOD, 1.0),
+            trough: MonotonicWindow::new(DRAWDOWN_PERIOD, -1.0),
+            close_window: Window::new(SMA_PERIOD),
+            true_range: Window::new(ATR_PERIOD),
+            volume_window: Window::new(VOLUME_PERIOD),
+        }
+    }
+
+    /// Drop all accumulated state.
+    fn reset(&mut self) {
+        *self = StreamingFactorEngineRs::new();
+    }
+
+    /// Advance every factor by one bar and return them in FACTOR_COLUMNS order.
+    fn update(&mut self, high: f64, low: f64, close: f64, volume: f64) -> [f64; N_FACTORS] {
+        let tick = self.tick.map_or(0, |t| t + 1);
+        self.tick = Some(tick);
+        let slots = self.closes.len();
+        self.closes[tick % slots] = close;
+        let prev_close = self.prev_close;
+        self.prev_close = close;
+
+        // Momentum
+        let lag_1m = self.lagged_close(tick, MOMENTUM_1M);
+        let lag_3m = self.lagged_close(tick, MOMENTUM_3M);
+        let lag_12m = self.lagged_close(tick, MOMENTUM_12M + MOMENTUM_12M_OFFSET);
+        let lag_offset = self.lagged_close(tick, MOMENTUM_12M_OFFSET);
+
+        // RSI (NaN deltas count as neither gain nor loss)
+        let delta = if tick > 0 { close - prev_close } else { 0.0 };
+        self.gains.push(if delta > 0.0 { delta } else { 0.0 });
+        self.losses.push(if delta < 0.0 { -delta } else { 0.0 });
+        let rsi = if tick + 1 >= RSI_PERIOD {
+            let (gain_sum, loss_sum) = (self.gains.total, self.losses.total);
+            if loss_sum != 0.0 {
+                100.0 - 100.0 / (1.0 + gain_sum / loss_sum)
+            } else if gain_sum > 0.0 {
+                100.0
+            } else {
+                f64::NAN
+            }
+        } else {
+            f64::NAN
+        };
+
+        // MACD
+        let macd = self.ema_fast.push(close) - self.ema_slow.push(close);
+
+        // Realised volatility
+        let ret = if tick > 0 { close / prev_close - 1.0 } else { f64::NAN };
+        self.returns_short.push(ret);
+        self.returns_long.push(ret);
+        let annualise = 252.0_f64.sqrt();
+
+        // Max drawdown
+        let peak = self.peak.push(tick, close);
+        let drawdown = (close - peak) / peak;
+        let trough = self.trough.push(tick, drawdown);
+
+        // SMA ratio and Bollinger position
+        self.close_window.push(close);
+        if tick % RESYNC_INTERVAL == 0 && tick >= SMA_PERIOD {
+            self.close_window.resync();
+        }
+        let sma = self.close_window.mean();
+        let std = self.close_window.std();
+
+        // ATR
+        let mut true_range = high - low;
+        if tick > 0 {
+            let up = (high - prev_close).abs();
+            let down = (low - prev_close).abs();
+            if true_range.is_nan() || up > true_range {
+                true_range = up;
+            }
+            if true_range.is_nan() || down > true_range {
+                true_range = down;
+            }
+        }
+        self.true_range.push(true_range);
+
+        // Volume
+        self.volume_window.push(volume);
+
+        [
+            (close - lag_1m) / lag_1m,
+            (close - lag_3m) / lag_3m,
+            (lag_offset - lag_12m) / lag_12m,
+            rsi,
+            macd,
+            self.returns_short.std() * annualise,
+            self.returns_long.std() * annualise,
+            trough,
+            close / sma,
+            (close - (sma - 2.0 * std)) / (4.0 * std),
+            self.true_range.mean(),
+            volume / self.volume_window.mean(),
+        ]
+    }
+}
+
+#[pymodule]
+fn ai_auto_investment_factors_rs(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_class::<StreamingFactorEngineRs>()?;
+    m.add("N_FACTORS", N_FACTORS)?;
+    Ok(())
+}